@@ -13,6 +13,9 @@ export interface ExtractedFields {
   vote_count: number | null;
   percentage: number | null;
   result_claim: string | null;
+  candidate_names: string[];
+  margin: number | null;
+  claimed_rank: number | null;
 }
 
 export interface OfficialData {
@@ -48,6 +51,22 @@ export interface ImageVerificationResponse extends VerificationResponse {
   extracted_text: string;
 }
 
+export type ImageJobState = "queued" | "processing" | "done" | "failed";
+
+export interface ImageJobResponse {
+  job_id: string;
+  status: ImageJobState;
+  poll_url: string;
+  events_url: string;
+}
+
+export interface ImageJobStatus {
+  job_id: string;
+  status: ImageJobState;
+  result: ImageVerificationResponse | null;
+  error: { status_code: number; detail: string } | null;
+}
+
 export interface SourceInfo {
   id: number;
   name: string;
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Batch-extract election entities from a file of claims.
+
+Usage:
+    python scripts/extract_claims.py data/test_claims.json
+    python scripts/extract_claims.py claims.txt --batch-size 256 --n-process 4
+
+Accepts a JSON list (strings or objects with a "claim" key) or plain text
+with one claim per line. Prints one JSON object per claim, in input order.
+"""
+
+import argparse
+import json
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server.services.entity_extractor import EntityExtractor, load_spacy_model
+
+
+def load_claims(path: str) -> list[str]:
+    with open(path, encoding="utf-8") as f:
+        raw = f.read()
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError:
+        return [line.strip() for line in raw.splitlines() if line.strip()]
+    return [item["claim"] if isinstance(item, dict) else str(item) for item in data]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--n-process", type=int, default=1)
+    args = parser.parse_args()
+
+    claims = load_claims(args.path)
+    extractor = EntityExtractor(load_spacy_model())
+    fields = extractor.extract_many(
+        claims, batch_size=args.batch_size, n_process=args.n_process
+    )
+    for claim, extracted in zip(claims, fields):
+        print(json.dumps({"claim": claim, "extracted_fields": extracted}))
+
+
+if __name__ == "__main__":
+    main()
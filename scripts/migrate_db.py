@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Bring the database schema up to date before the app starts.
+
+A fresh database gets its tables from the models (create_all) and is
+stamped at the latest revision; an existing one is migrated with
+`alembic upgrade head`. Exits non-zero on failure so the deploy stops
+rather than starting against an old schema.
+"""
+
+import asyncio
+import os
+import sys
+
+# Add project root to path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+
+from server.db.session import engine
+from server.models.database import Base
+
+
+async def _create_if_fresh() -> bool:
+    """Create the tables if election_results does not exist yet. Returns True if it did."""
+    async with engine.begin() as conn:
+        fresh = not await conn.run_sync(lambda c: inspect(c).has_table("election_results"))
+        if fresh:
+            await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+    return fresh
+
+
+def main():
+    config = Config(os.path.join(ROOT, "alembic.ini"))
+    if asyncio.run(_create_if_fresh()):
+        command.stamp(config, "head")
+        print("Created tables and stamped schema at head.")
+    else:
+        command.upgrade(config, "head")
+        print("Schema migrated to head.")
+
+
+if __name__ == "__main__":
+    main()
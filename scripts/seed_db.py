@@ -12,6 +12,8 @@ from sqlalchemy import select, func, delete
 from server.db.session import AsyncSessionLocal, engine
 from server.models.database import Base, ElectionResult, OfficialSource
 from server.db.seed import SEED_SOURCE, SEED_RESULTS
+from server.services.contests import refresh_contest_summaries
+from server.services.normalization import result_keys
 
 
 async def seed(force: bool = False):
@@ -41,9 +43,19 @@ async def seed(force: bool = False):
 
         # Create election results
         for result_data in SEED_RESULTS:
-            result = ElectionResult(source_id=source.id, **result_data)
+            result = ElectionResult(
+                source_id=source.id,
+                **result_data,
+                **result_keys(
+                    result_data["candidate_name"],
+                    result_data["district"],
+                    result_data["position"],
+                ),
+            )
             db.add(result)
 
+        await db.flush()
+        await refresh_contest_summaries(db)
         await db.commit()
         print(f"Seeded {len(SEED_RESULTS)} election results from {SEED_SOURCE['name']}")
 
@@ -5,15 +5,15 @@ from alembic import context
 from sqlalchemy import pool
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
-from server.config import Settings
+from server.db.session import db_url
 from server.models.database import Base
 
 # Alembic Config object
 config = context.config
 
-# Set the SQLAlchemy URL from our settings
-settings = Settings()
-config.set_main_option("sqlalchemy.url", settings.database_url)
+# Set the SQLAlchemy URL from our settings (normalized to asyncpg, as
+# Render/Railway provide postgresql:// URLs)
+config.set_main_option("sqlalchemy.url", db_url)
 
 # Interpret the config file for Python logging
 if config.config_file_name is not None:
@@ -0,0 +1,45 @@
+"""pg_trgm GIN indexes on election_results
+
+Revision ID: 0001_pg_trgm_indexes
+Revises:
+Create Date: 2026-10-17 09:00:00.000000
+
+Tables themselves are created by the app on startup (Base.metadata.create_all),
+which also creates these indexes on a fresh database; this revision brings
+existing databases up to date.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_pg_trgm_indexes"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRGM_COLUMNS = ("candidate_name", "district", "position")
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in TRGM_COLUMNS:
+        op.create_index(
+            f"ix_election_results_{column}_trgm",
+            "election_results",
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    for column in TRGM_COLUMNS:
+        op.drop_index(
+            f"ix_election_results_{column}_trgm",
+            table_name="election_results",
+            if_exists=True,
+        )
@@ -0,0 +1,82 @@
+"""Normalized key columns on election_results
+
+Revision ID: 0002_normalized_keys
+Revises: 0001_pg_trgm_indexes
+Create Date: 2026-10-17 12:00:00.000000
+
+Adds name_key, surname_key, district_key and position_key with btree
+indexes, and backfills existing rows using the same normalization the
+ingest code applies (server/services/normalization.py).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from server.services.normalization import result_keys
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_normalized_keys"
+down_revision: Union[str, None] = "0001_pg_trgm_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+KEY_COLUMNS = (
+    ("name_key", 255),
+    ("surname_key", 100),
+    ("district_key", 255),
+    ("position_key", 255),
+)
+INDEXED_KEYS = ("surname_key", "district_key", "position_key")
+
+
+def upgrade() -> None:
+    # IF NOT EXISTS: create_all may already have added them on startup
+    for name, length in KEY_COLUMNS:
+        op.execute(
+            f"ALTER TABLE election_results ADD COLUMN IF NOT EXISTS {name} VARCHAR({length})"
+        )
+
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text("SELECT id, candidate_name, district, position FROM election_results")
+    ).fetchall()
+    if rows:
+        bind.execute(
+            sa.text(
+                "UPDATE election_results SET name_key = :name_key, "
+                "surname_key = :surname_key, district_key = :district_key, "
+                "position_key = :position_key WHERE id = :id"
+            ),
+            [
+                {
+                    "id": r.id,
+                    **{
+                        name: value
+                        for name, value in result_keys(r.candidate_name, r.district, r.position).items()
+                        if name in dict(KEY_COLUMNS)
+                    },
+                }
+                for r in rows
+            ],
+        )
+
+    for name in INDEXED_KEYS:
+        op.create_index(
+            f"ix_election_results_{name}",
+            "election_results",
+            [name],
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    for name in INDEXED_KEYS:
+        op.drop_index(
+            f"ix_election_results_{name}",
+            table_name="election_results",
+            if_exists=True,
+        )
+    for name, _ in KEY_COLUMNS:
+        op.execute(f"ALTER TABLE election_results DROP COLUMN IF EXISTS {name}")
@@ -0,0 +1,59 @@
+"""Phonetic name keys on election_results
+
+Revision ID: 0003_name_phonetics
+Revises: 0002_normalized_keys
+Create Date: 2026-10-17 14:00:00.000000
+
+Adds name_phonetics (one phonetic key per candidate name token) with a GIN
+index, and backfills existing rows with normalization.phonetic_keys.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from server.services.normalization import phonetic_keys
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_name_phonetics"
+down_revision: Union[str, None] = "0002_normalized_keys"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # IF NOT EXISTS: create_all may already have added it on startup
+    op.execute(
+        "ALTER TABLE election_results ADD COLUMN IF NOT EXISTS name_phonetics VARCHAR(64)[]"
+    )
+
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text("SELECT id, candidate_name FROM election_results")
+    ).fetchall()
+    if rows:
+        bind.execute(
+            sa.text(
+                "UPDATE election_results SET name_phonetics = :name_phonetics WHERE id = :id"
+            ).bindparams(sa.bindparam("name_phonetics", type_=ARRAY(sa.String(64)))),
+            [{"id": r.id, "name_phonetics": phonetic_keys(r.candidate_name)} for r in rows],
+        )
+
+    op.create_index(
+        "ix_election_results_name_phonetics",
+        "election_results",
+        ["name_phonetics"],
+        postgresql_using="gin",
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_election_results_name_phonetics",
+        table_name="election_results",
+        if_exists=True,
+    )
+    op.execute("ALTER TABLE election_results DROP COLUMN IF EXISTS name_phonetics")
@@ -0,0 +1,36 @@
+"""Contest lookup index on election_results
+
+Revision ID: 0004_contest_index
+Revises: 0003_name_phonetics
+Create Date: 2026-10-17 16:00:00.000000
+
+Composite (election_year, position_key, district_key) index used to load
+every candidate of a race in one query (services/contests.py).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_contest_index"
+down_revision: Union[str, None] = "0003_name_phonetics"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_election_results_contest",
+        "election_results",
+        ["election_year", "position_key", "district_key"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_election_results_contest",
+        table_name="election_results",
+        if_exists=True,
+    )
@@ -0,0 +1,63 @@
+"""contest_summaries table
+
+Revision ID: 0005_contest_summaries
+Revises: 0004_contest_index
+Create Date: 2026-10-17 18:00:00.000000
+
+Per-contest aggregates (winner, runner-up, margin, ranks, totals), kept
+current at ingest by refresh_contest_summaries(). Existing results are
+summarized here with the same code.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+from server.services.contests import group_contests, summary_values
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_contest_summaries"
+down_revision: Union[str, None] = "0004_contest_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    summaries = op.create_table(
+        "contest_summaries",
+        sa.Column("contest_key", sa.String(512), primary_key=True),
+        sa.Column("election_year", sa.Integer(), nullable=False),
+        sa.Column("position_key", sa.String(255), nullable=False),
+        sa.Column("district_key", sa.String(255), nullable=False),
+        sa.Column("constituency_key", sa.String(255), nullable=False, server_default=""),
+        sa.Column("polling_station_key", sa.String(255), nullable=False, server_default=""),
+        sa.Column("winner_result_id", sa.Integer(), nullable=True),
+        sa.Column("runner_up_result_id", sa.Integer(), nullable=True),
+        sa.Column("margin", sa.Integer(), nullable=True),
+        sa.Column("total_votes", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_valid_votes", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("candidate_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("standings", JSONB(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+        if_not_exists=True,
+    )
+
+    rows = op.get_bind().execute(
+        sa.text(
+            "SELECT id, election_year, position, district, constituency, "
+            "polling_station, candidate_name, party, vote_count, is_winner, "
+            "total_valid_votes FROM election_results"
+        )
+    ).fetchall()
+    contests = group_contests(rows)
+    if contests:
+        op.get_bind().execute(
+            sa.text("DELETE FROM contest_summaries")
+        )
+        op.bulk_insert(summaries, [summary_values(c) for c in contests.values()])
+
+
+def downgrade() -> None:
+    op.drop_table("contest_summaries", if_exists=True)
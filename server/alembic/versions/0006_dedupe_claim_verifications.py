@@ -0,0 +1,80 @@
+"""Deduplicated claim_verifications
+
+Revision ID: 0006_dedupe_claim_verifications
+Revises: 0005_contest_summaries
+Create Date: 2026-10-17 20:00:00.000000
+
+One row per (claim fingerprint, data version) with a hit counter and
+last-seen time, upserted by the verification writer. Rows written before
+this revision get a unique legacy fingerprint and age out normally.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_dedupe_claim_verifications"
+down_revision: Union[str, None] = "0005_contest_summaries"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _is_partitioned() -> bool:
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass('claim_verifications'))"
+        )
+    ).scalar()
+
+
+def upgrade() -> None:
+    if _is_partitioned():
+        # Created by create_all with the current (partitioned) model, which
+        # already has these columns; a unique key without the partition key
+        # would be rejected
+        return
+
+    # IF NOT EXISTS: create_all may already have added them on startup
+    op.execute(
+        """
+        ALTER TABLE claim_verifications
+            ADD COLUMN IF NOT EXISTS fingerprint VARCHAR(64),
+            ADD COLUMN IF NOT EXISTS data_version VARCHAR(64) NOT NULL DEFAULT '',
+            ADD COLUMN IF NOT EXISTS last_seen TIMESTAMP DEFAULT now(),
+            ADD COLUMN IF NOT EXISTS hit_count INTEGER NOT NULL DEFAULT 1
+        """
+    )
+    op.execute(
+        "UPDATE claim_verifications SET fingerprint = 'legacy:' || id, "
+        "last_seen = verified_at WHERE fingerprint IS NULL"
+    )
+    op.execute("ALTER TABLE claim_verifications ALTER COLUMN fingerprint SET NOT NULL")
+    op.execute(
+        "ALTER TABLE claim_verifications DROP CONSTRAINT IF EXISTS "
+        "uq_claim_verifications_fingerprint_version"
+    )
+    op.create_unique_constraint(
+        "uq_claim_verifications_fingerprint_version",
+        "claim_verifications",
+        ["fingerprint", "data_version"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uq_claim_verifications_fingerprint_version",
+        "claim_verifications",
+        type_="unique",
+    )
+    op.execute(
+        """
+        ALTER TABLE claim_verifications
+            DROP COLUMN IF EXISTS fingerprint,
+            DROP COLUMN IF EXISTS data_version,
+            DROP COLUMN IF EXISTS last_seen,
+            DROP COLUMN IF EXISTS hit_count
+        """
+    )
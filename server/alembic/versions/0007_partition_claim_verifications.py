@@ -0,0 +1,152 @@
+"""Partition claim_verifications by hour of expiry
+
+Revision ID: 0007_partition_claim_verifications
+Revises: 0006_dedupe_claim_verifications
+Create Date: 2026-10-17 21:00:00.000000
+
+Recreates claim_verifications as a table range-partitioned on expires_at
+(hourly partitions plus a DEFAULT, see services/claim_partitions.py) and
+copies over the rows that have not expired, with expires_at rounded down
+to the hour. The id sequence is kept.
+"""
+from datetime import datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from server.config import Settings
+from server.services.claim_partitions import partition_ddl, partition_starts
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007_partition_claim_verifications"
+down_revision: Union[str, None] = "0006_dedupe_claim_verifications"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    "id, fingerprint, data_version, claim_text, claim_type, extracted_text, "
+    "extracted_fields, matched_result_id, alignment_status, confidence, "
+    "explanation, ip_hash, verified_at, last_seen, hit_count"
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    partitioned = bind.execute(
+        sa.text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass('claim_verifications'))"
+        )
+    ).scalar()
+    if partitioned:
+        # Created partitioned by create_all on startup
+        return
+
+    op.execute("ALTER TABLE claim_verifications RENAME TO claim_verifications_old")
+    op.execute(
+        "ALTER TABLE claim_verifications_old "
+        "RENAME CONSTRAINT claim_verifications_pkey TO claim_verifications_old_pkey"
+    )
+    op.execute(
+        "ALTER TABLE claim_verifications_old DROP CONSTRAINT IF EXISTS "
+        "uq_claim_verifications_fingerprint_version"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_claim_verifications_expires_at")
+    op.execute("ALTER SEQUENCE claim_verifications_id_seq OWNED BY NONE")
+
+    op.execute(
+        """
+        CREATE TABLE claim_verifications (
+            id INTEGER NOT NULL DEFAULT nextval('claim_verifications_id_seq'),
+            fingerprint VARCHAR(64) NOT NULL,
+            data_version VARCHAR(64) NOT NULL DEFAULT '',
+            claim_text TEXT NOT NULL,
+            claim_type VARCHAR(50) NOT NULL,
+            extracted_text TEXT,
+            extracted_fields JSONB,
+            matched_result_id INTEGER REFERENCES election_results (id),
+            alignment_status VARCHAR(50) NOT NULL,
+            confidence FLOAT NOT NULL,
+            explanation TEXT,
+            ip_hash VARCHAR(64),
+            verified_at TIMESTAMP DEFAULT now(),
+            last_seen TIMESTAMP DEFAULT now(),
+            hit_count INTEGER NOT NULL DEFAULT 1,
+            expires_at TIMESTAMP NOT NULL,
+            PRIMARY KEY (id, expires_at),
+            CONSTRAINT uq_claim_verifications_fingerprint_version_expiry
+                UNIQUE (fingerprint, data_version, expires_at)
+        ) PARTITION BY RANGE (expires_at)
+        """
+    )
+    op.execute("ALTER SEQUENCE claim_verifications_id_seq OWNED BY claim_verifications.id")
+    op.create_index("ix_claim_verifications_expires_at", "claim_verifications", ["expires_at"])
+    op.execute(
+        "CREATE TABLE claim_verifications_default PARTITION OF claim_verifications DEFAULT"
+    )
+
+    settings = Settings()
+    now = datetime.utcnow()
+    # From the earliest live expiry hour up to the startup/Celery horizon
+    for start in partition_starts(
+        now - timedelta(hours=settings.claim_retention_hours),
+        settings.claim_retention_hours,
+        settings.claim_retention_hours + settings.claim_partitions_ahead_hours,
+    ):
+        op.execute(partition_ddl(start))
+
+    bind.execute(
+        sa.text(
+            f"INSERT INTO claim_verifications ({COLUMNS}, expires_at) "
+            f"SELECT {COLUMNS}, date_trunc('hour', expires_at) "
+            "FROM claim_verifications_old WHERE date_trunc('hour', expires_at) > :now"
+        ),
+        {"now": now},
+    )
+    op.execute("DROP TABLE claim_verifications_old")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE claim_verifications RENAME TO claim_verifications_partitioned")
+    op.execute(
+        "ALTER TABLE claim_verifications_partitioned "
+        "RENAME CONSTRAINT claim_verifications_pkey TO claim_verifications_partitioned_pkey"
+    )
+    op.execute("ALTER SEQUENCE claim_verifications_id_seq OWNED BY NONE")
+    op.execute("DROP INDEX IF EXISTS ix_claim_verifications_expires_at")
+    op.execute(
+        """
+        CREATE TABLE claim_verifications (
+            id INTEGER PRIMARY KEY DEFAULT nextval('claim_verifications_id_seq'),
+            fingerprint VARCHAR(64) NOT NULL,
+            data_version VARCHAR(64) NOT NULL DEFAULT '',
+            claim_text TEXT NOT NULL,
+            claim_type VARCHAR(50) NOT NULL,
+            extracted_text TEXT,
+            extracted_fields JSONB,
+            matched_result_id INTEGER REFERENCES election_results (id),
+            alignment_status VARCHAR(50) NOT NULL,
+            confidence FLOAT NOT NULL,
+            explanation TEXT,
+            ip_hash VARCHAR(64),
+            verified_at TIMESTAMP DEFAULT now(),
+            last_seen TIMESTAMP DEFAULT now(),
+            hit_count INTEGER NOT NULL DEFAULT 1,
+            expires_at TIMESTAMP NOT NULL,
+            CONSTRAINT uq_claim_verifications_fingerprint_version
+                UNIQUE (fingerprint, data_version)
+        )
+        """
+    )
+    op.execute("ALTER SEQUENCE claim_verifications_id_seq OWNED BY claim_verifications.id")
+    op.create_index("ix_claim_verifications_expires_at", "claim_verifications", ["expires_at"])
+    # Keep the latest expiry hour of each claim
+    op.execute(
+        f"INSERT INTO claim_verifications ({COLUMNS}, expires_at) "
+        f"SELECT DISTINCT ON (fingerprint, data_version) {COLUMNS}, expires_at "
+        "FROM claim_verifications_partitioned "
+        "ORDER BY fingerprint, data_version, expires_at DESC"
+    )
+    op.execute("DROP TABLE claim_verifications_partitioned")
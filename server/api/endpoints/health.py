@@ -1,4 +1,6 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+
+from server.services.contests import contest_cache
 
 router = APIRouter()
 
@@ -14,16 +16,12 @@ async def health_check():
 
 
 @router.get("/health/detailed")
-async def detailed_health_check():
+async def detailed_health_check(request: Request):
     """Full health check including database and Redis status."""
     from sqlalchemy import func, select
 
-    from server.config import Settings
     from server.db.session import AsyncSessionLocal
     from server.models.database import ElectionResult
-    from server.services.cache_service import CacheService
-
-    settings = Settings()
 
     # Check database
     db_ok = True
@@ -43,8 +41,8 @@ async def detailed_health_check():
     except Exception as e:
         db_ok = False
 
-    # Check Redis
-    cache = CacheService(settings.redis_url)
+    # Check Redis (shares the app cache's circuit breaker)
+    cache = request.app.state.cache
     redis_ok = await cache.is_healthy()
 
     return {
@@ -53,4 +51,26 @@ async def detailed_health_check():
         "redis": redis_ok,
         "ec_data_last_updated": ec_last_updated,
         "total_official_results": total_results,
+        "workers": {
+            "nlp": request.app.state.nlp_pool.stats(),
+            "ocr": request.app.state.ocr_pool.stats(),
+            "verification_writer": request.app.state.verification_writer.stats(),
+        },
+        "caches": {
+            "verification": cache.stats(),
+            "image": request.app.state.image_cache.stats(),
+            "single_flight": request.app.state.single_flight.stats(),
+            "results_snapshot": request.app.state.results_snapshot.stats(),
+            "contests": contest_cache.stats(),
+            "match_batcher": (
+                request.app.state.match_batcher.stats()
+                if request.app.state.match_batcher
+                else None
+            ),
+            "extract_batcher": (
+                request.app.state.extract_batcher.stats()
+                if request.app.state.extract_batcher
+                else None
+            ),
+        },
     }
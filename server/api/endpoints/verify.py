@@ -1,24 +1,23 @@
+import asyncio
+import base64
 import hashlib
-from datetime import datetime, timedelta
+import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, File
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.config import Settings
 from server.db.session import get_db
-from server.models.database import ClaimVerification
 from server.models.schemas import (
-    ExtractedFields,
+    ImageJobResponse,
+    ImageJobStatus,
     ImageVerificationResponse,
-    OfficialDataResponse,
-    SourceReferenceResponse,
     TextVerifyRequest,
     VerificationResponse,
 )
-from server.services.deterministic_matcher import DeterministicMatcher
-from server.services.entity_extractor import EntityExtractor
-from server.services.explanation_generator import ExplanationGenerator
-from server.services.ocr_processor import OCRProcessor
+from server.services.ocr_processor import ocr_in_worker
+from server.services.worker_pool import PoolSaturatedError, PoolTimeoutError
 
 router = APIRouter()
 settings = Settings()
@@ -31,88 +30,38 @@ async def _verify_claim_text(
     db: AsyncSession,
     extracted_text: str | None = None,
 ) -> dict:
-    """Shared verification pipeline for text and image claims."""
-
-    nlp = request.app.state.nlp
-
-    # 1. Extract entities
-    extractor = EntityExtractor(nlp)
-    extracted = extractor.extract(claim_text)
-
-    # 2. Match against official data
-    matcher = DeterministicMatcher()
-    match_result = await matcher.match(extracted, db)
-
-    # 3. Generate explanation
-    generator = ExplanationGenerator()
-    explanation = generator.generate(
-        match_result.alignment,
-        extracted,
-        match_result.official_result,
-        match_result.conflicts,
-    )
-
-    # 4. Build response data
-    official_data = None
-    source_ref = None
-
-    if match_result.official_result:
-        r = match_result.official_result
-        s = match_result.source
-
-        official_data = OfficialDataResponse(
-            candidate_name=r.candidate_name,
-            party=r.party or "Independent",
-            position=r.position,
-            district=r.district,
-            vote_count=r.vote_count,
-            percentage=r.percentage or 0.0,
-            total_votes=r.total_valid_votes or 0,
-            source_name=s.name if s else "Uganda Electoral Commission",
-            source_url=s.url if s else None,
-            last_updated=r.last_updated or datetime.utcnow(),
+    """Run the shared verification pipeline, mapping pool errors to HTTP."""
+    try:
+        return await request.app.state.pipeline.verify(
+            claim_text,
+            claim_type,
+            db,
+            client_host=request.client.host if request.client else None,
+            extracted_text=extracted_text,
         )
-
-        source_ref = SourceReferenceResponse(
-            name=s.name if s else "Uganda Electoral Commission",
-            url=s.url if s else None,
-            last_updated=s.last_scraped or r.last_updated or datetime.utcnow(),
+    except PoolSaturatedError:
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy. Please try again shortly.",
+            headers={"Retry-After": "1"},
+        )
+    except PoolTimeoutError:
+        raise HTTPException(
+            status_code=504,
+            detail="Claim analysis timed out. Try a shorter claim.",
         )
 
-    # 5. Store verification record (auto-expires in 24h)
-    now = datetime.utcnow()
-    ip_hash = hashlib.sha256(
-        (request.client.host or "unknown").encode()
-    ).hexdigest()[:16]
 
-    verification = ClaimVerification(
-        claim_text=claim_text[:500],  # Truncate for privacy
-        claim_type=claim_type,
-        extracted_text=extracted_text,
-        extracted_fields=extracted,
-        matched_result_id=(
-            match_result.official_result.id if match_result.official_result else None
-        ),
-        alignment_status=match_result.alignment.value,
-        confidence=match_result.confidence,
-        explanation=explanation,
-        ip_hash=ip_hash,
-        verified_at=now,
-        expires_at=now + timedelta(hours=settings.claim_retention_hours),
+def _record_image_hit(request: Request, result: dict, data_version: str) -> None:
+    """Count a response served from the image cache against its claim's row."""
+    request.app.state.pipeline.record(
+        result,
+        result["extracted_text"],
+        "image",
+        result["extracted_text"],
+        data_version,
+        request.client.host if request.client else None,
     )
-    db.add(verification)
-    await db.commit()
-
-    return {
-        "alignment": match_result.alignment.value,
-        "extracted_fields": ExtractedFields(**extracted),
-        "official_data": official_data,
-        "explanation": explanation,
-        "confidence": match_result.confidence,
-        "source_reference": source_ref,
-        "verified_at": now,
-        "extracted_text": extracted_text,
-    }
 
 
 @router.post("/verify/text", response_model=VerificationResponse)
@@ -130,33 +79,91 @@ async def verify_text_claim(
     return VerificationResponse(**{k: v for k, v in result.items() if k != "extracted_text"})
 
 
+UPLOAD_CHUNK_BYTES = 64 * 1024
+
+# Magic-byte prefixes for accepted formats (WebP is RIFF....WEBP)
+IMAGE_SIGNATURES = {
+    "image/jpeg": (b"\xff\xd8\xff",),
+    "image/png": (b"\x89PNG\r\n\x1a\n",),
+}
+
+
+def _sniff_image_type(head: bytes) -> str | None:
+    for content_type, prefixes in IMAGE_SIGNATURES.items():
+        if head.startswith(prefixes):
+            return content_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+async def _read_image_upload(image: UploadFile) -> bytes:
+    max_bytes = settings.max_image_size_mb * 1024 * 1024
+
+    head = await image.read(UPLOAD_CHUNK_BYTES)
+    if _sniff_image_type(head) is None:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid image format. Please upload JPG, PNG, or WebP.",
+        )
+
+    buffer = bytearray(head)
+    while len(buffer) <= max_bytes:
+        chunk = await image.read(UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            return bytes(buffer)
+        buffer += chunk
+
+    raise HTTPException(
+        status_code=400,
+        detail=f"Image too large. Maximum size is {settings.max_image_size_mb}MB.",
+    )
+
+
+def _ocr_busy() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="Too many images are being processed. Please try again shortly.",
+        headers={"Retry-After": str(settings.ocr_retry_after_seconds)},
+    )
+
+
 @router.post("/verify/image", response_model=ImageVerificationResponse)
 async def verify_image_claim(
     request: Request,
     image: UploadFile = File(...),
     db: AsyncSession = Depends(get_db),
 ):
-    # Validate file size
-    contents = await image.read()
-    max_bytes = settings.max_image_size_mb * 1024 * 1024
-    if len(contents) > max_bytes:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Image too large. Maximum size is {settings.max_image_size_mb}MB.",
-        )
+    # Shed load before reading the upload if OCR is already backed up
+    if request.app.state.ocr_pool.saturated:
+        raise _ocr_busy()
 
-    # Validate content type
-    content_type = image.content_type or ""
-    if content_type not in ("image/jpeg", "image/png", "image/webp"):
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid image format. Please upload JPG, PNG, or WebP.",
-        )
+    # Read in chunks, verifying the format from magic bytes first and
+    # aborting as soon as the size limit is exceeded
+    contents = await _read_image_upload(image)
 
-    # OCR
-    ocr = OCRProcessor(settings.tesseract_cmd)
+    # Repeated screenshots: exact bytes skip OCR entirely (for the current
+    # official data only)
+    image_cache = request.app.state.image_cache
+    image_sha = hashlib.sha256(contents).hexdigest()
+    data_version = await request.app.state.data_version.current(db)
+    cached = image_cache.get_exact(image_sha, data_version)
+    if cached is not None:
+        _record_image_hit(request, cached, data_version)
+        return ImageVerificationResponse(**cached)
+
+    # OCR and dHash (in the OCR process pool, never on the event loop)
     try:
-        extracted_text = ocr.extract_text(contents)
+        extracted_text, image_dhash = await request.app.state.ocr_pool.run(
+            ocr_in_worker, contents
+        )
+    except PoolSaturatedError:
+        raise _ocr_busy()
+    except PoolTimeoutError:
+        raise HTTPException(
+            status_code=504,
+            detail="Text extraction timed out. Try a smaller or clearer screenshot.",
+        )
     except Exception as e:
         raise HTTPException(
             status_code=422,
@@ -169,6 +176,15 @@ async def verify_image_claim(
             detail="No text could be extracted from the image. Try a clearer screenshot.",
         )
 
+    # Near-duplicate copy (re-compressed, resized) with the same text
+    if image_dhash is not None:
+        cached = image_cache.get_similar(image_dhash, data_version, extracted_text)
+        if cached is not None:
+            result = {**cached, "extracted_text": extracted_text}
+            image_cache.put(image_sha, image_dhash, result, data_version)
+            _record_image_hit(request, result, data_version)
+            return ImageVerificationResponse(**result)
+
     # Image bytes are NOT stored — privacy requirement
     result = await _verify_claim_text(
         claim_text=extracted_text,
@@ -178,4 +194,143 @@ async def verify_image_claim(
         extracted_text=extracted_text,
     )
 
+    # Cache only the text and result, keyed by hashes — never the bytes
+    image_cache.put(image_sha, image_dhash, result, data_version)
+
     return ImageVerificationResponse(**result)
+
+
+# ── Async image jobs ──────────────────────────────────────────────────
+# Opt-in alternative to /verify/image for slow connections: the upload is
+# handed to a Celery worker inside the task message (never written to
+# disk) and the client polls, or listens over Server-Sent Events, for
+# the result.
+
+
+def _job_store(request: Request):
+    if not settings.image_jobs_enabled:
+        raise HTTPException(
+            status_code=404,
+            detail="Async image verification is not enabled. Use /api/verify/image.",
+        )
+    return request.app.state.job_store
+
+
+def _jobs_unavailable() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="Async image verification is unavailable. Use /api/verify/image.",
+        headers={"Retry-After": str(settings.ocr_retry_after_seconds)},
+    )
+
+
+def _job_status(request: Request, job: dict) -> ImageJobStatus:
+    image_cache = request.app.state.image_cache
+    if (
+        job["status"] == "done"
+        and job.get("image_sha")
+        and not image_cache.contains(job["image_sha"], job["data_version"])
+    ):
+        # First sight of the finished job: let repeats of the screenshot
+        # (exact or near-duplicate) hit the synchronous endpoint's cache
+        image_cache.put(
+            job["image_sha"], job.get("image_dhash"), job["result"], job["data_version"]
+        )
+    return ImageJobStatus(
+        job_id=job["job_id"],
+        status=job["status"],
+        result=job.get("result"),
+        error=job.get("error"),
+    )
+
+
+@router.post("/verify/image/jobs", response_model=ImageJobResponse, status_code=202)
+async def submit_image_job(
+    request: Request,
+    image: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
+):
+    from server.tasks.celery_app import celery_app
+    from server.tasks.verify_tasks import VERIFY_IMAGE_TASK
+
+    jobs = _job_store(request)
+    contents = await _read_image_upload(image)
+
+    job_id = uuid.uuid4().hex
+    image_sha = hashlib.sha256(contents).hexdigest()
+    data_version = await request.app.state.data_version.current(db)
+    cached = request.app.state.image_cache.get_exact(image_sha, data_version)
+    try:
+        if cached is not None:
+            job = await jobs.create(job_id, status="done", result=cached)
+            _record_image_hit(request, cached, data_version)
+        else:
+            job = await jobs.create(job_id, image_sha=image_sha, data_version=data_version)
+            # send_task publishes to the broker synchronously; keep it off the loop
+            await asyncio.to_thread(
+                celery_app.send_task,
+                VERIFY_IMAGE_TASK,
+                args=[
+                    job_id,
+                    base64.b64encode(contents).decode("ascii"),
+                    request.client.host if request.client else "unknown",
+                ],
+            )
+    except Exception as e:
+        print(f"WARNING: Could not queue image job: {e}")
+        raise _jobs_unavailable()
+
+    return ImageJobResponse(
+        job_id=job_id,
+        status=job["status"],
+        poll_url=f"/api/verify/jobs/{job_id}",
+        events_url=f"/api/verify/jobs/{job_id}/events",
+    )
+
+
+@router.get("/verify/jobs/{job_id}", response_model=ImageJobStatus)
+async def get_image_job(job_id: str, request: Request):
+    jobs = _job_store(request)
+    try:
+        job = await jobs.get(job_id)
+    except Exception:
+        raise _jobs_unavailable()
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired.")
+    return _job_status(request, job)
+
+
+@router.get("/verify/jobs/{job_id}/events")
+async def stream_image_job(job_id: str, request: Request):
+    """Server-Sent Events: one event per status change, ending when the job finishes."""
+    jobs = _job_store(request)
+    try:
+        job = await jobs.get(job_id)
+    except Exception:
+        raise _jobs_unavailable()
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired.")
+
+    async def events():
+        try:
+            async for job in jobs.watch(
+                job_id,
+                timeout=settings.image_job_ttl_seconds,
+                heartbeat=settings.image_job_sse_heartbeat_seconds,
+            ):
+                if await request.is_disconnected():
+                    return
+                if job is None:
+                    # Comment line: keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                status = _job_status(request, job)
+                yield f"event: {status.status}\ndata: {status.model_dump_json()}\n\n"
+        except Exception as e:
+            print(f"WARNING: Job event stream {job_id} ended: {e}")
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
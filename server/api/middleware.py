@@ -0,0 +1,82 @@
+import json
+
+from starlette.exceptions import HTTPException
+
+TOO_LARGE_DETAIL = "Request body too large."
+
+
+class _BodyTooLarge(HTTPException):
+    """
+    Raised from receive() once the limit is passed. An HTTPException so
+    that, raised mid form parse, FastAPI re-raises it (rather than wrapping
+    it as a 400) and the app's exception handler answers 413.
+    """
+
+    def __init__(self):
+        super().__init__(status_code=413, detail=TOO_LARGE_DETAIL)
+
+
+class BodySizeLimitMiddleware:
+    """
+    Reject request bodies over a per-path byte limit while they stream in.
+
+    Multipart uploads are otherwise parsed (and spooled) in full before the
+    endpoint runs, so an oversized image would be buffered before its size
+    check. This stops reading at the limit, or immediately when
+    Content-Length already says the body is too big.
+    """
+
+    def __init__(self, app, limits: dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope, receive, send):
+        limit = self.limits.get(scope.get("path", "")) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        content_length = headers.get(b"content-length")
+        if content_length and content_length.isdigit() and int(content_length) > limit:
+            await self._reject(send)
+            return
+
+        received = 0
+        response_started = False
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise _BodyTooLarge()
+            return message
+
+        async def tracking_send(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except _BodyTooLarge:
+            # Not handled inside the app (raised outside a route)
+            if not response_started:
+                await self._reject(send)
+
+    async def _reject(self, send):
+        body = json.dumps({"detail": TOO_LARGE_DETAIL}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 413,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
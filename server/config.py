@@ -8,16 +8,70 @@ class Settings(BaseSettings):
     # Redis — optional, app works without it
     redis_url: str = "redis://localhost:6379/0"
 
+    # Verification cache — responses keyed on claim text + official data version
+    verification_cache_ttl_seconds: int = 300
+    cache_l1_max_entries: int = 4096
+    cache_l1_ttl_seconds: int = 60
+    data_version_ttl_seconds: int = 30
+
+    # Matcher — "snapshot" (in-memory indexes) or "sql" (query per claim)
+    matcher_backend: str = "snapshot"
+    # SQL backend only: coalesce lookups arriving within this window into
+    # one batched query (0 = off)
+    matcher_batch_window_ms: float = 0
+    matcher_batch_max_size: int = 64
+
     # EC Scraper
     ec_base_url: str = "https://www.ec.or.ug"
     ec_scrape_interval_hours: int = 6
 
     # Privacy
     claim_retention_hours: int = 24
+    # claim_verifications is partitioned by hour of expiry; partitions are
+    # created this many hours ahead of the rows that will use them
+    claim_partitions_ahead_hours: int = 24
+    # Row deletes left to cleanup (DEFAULT partition, unpartitioned table):
+    # "single" (one DELETE) or "chunked" (batches, committed and paced)
+    cleanup_mode: str = "chunked"
+    cleanup_batch_size: int = 5000
+    cleanup_batch_sleep_seconds: float = 0.2
+    # Verification records are written behind the response, in batches
+    verification_flush_batch_size: int = 500
+    verification_flush_interval_seconds: float = 1.0
+    verification_writer_max_pending: int = 10000
+
+    # NLP worker pool — "thread" or "process"; 0 workers = one per CPU core
+    nlp_executor: str = "thread"
+    nlp_workers: int = 0
+    nlp_max_queue: int = 64
+    nlp_timeout_seconds: float = 10.0
+    # Coalesce claims arriving within this window into one nlp.pipe batch
+    # (0 = off)
+    nlp_batch_window_ms: float = 0
+    nlp_batch_max_size: int = 64
 
     # OCR
     tesseract_cmd: str = "/usr/bin/tesseract"
+    # "pytesseract" (subprocess per image) or "tesserocr" (persistent engine per worker)
+    ocr_backend: str = "pytesseract"
+    tessdata_path: str = ""
     max_image_size_mb: int = 5
+    # OCR process pool — 0 workers = one per CPU core
+    ocr_workers: int = 0
+    ocr_max_queue: int = 16
+    ocr_timeout_seconds: float = 30.0
+    ocr_retry_after_seconds: int = 5
+    # Image cache — stores OCR text + result only, keyed by SHA-256 and dHash
+    image_cache_max_entries: int = 2048
+    image_cache_ttl_seconds: int = 900
+    # Near-duplicate screenshots are served only if their OCR text matches
+    image_cache_hamming_threshold: int = 2
+    # Async image jobs (POST /api/verify/image/jobs): OCR and verification
+    # run on the Celery workers; the image travels only inside the task
+    # message. Needs Redis and a running worker, so off by default
+    image_jobs_enabled: bool = False
+    image_job_ttl_seconds: int = 900
+    image_job_sse_heartbeat_seconds: float = 15.0
 
     # App — CORS origins (comma-separated in env, or JSON list)
     cors_origins: list[str] = [
@@ -5,8 +5,25 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
+from server.api.middleware import BodySizeLimitMiddleware
 from server.api.router import api_router
 from server.config import Settings
+from server.services.cache_service import CacheService
+from server.services.contests import contest_cache, refresh_contest_summaries
+from server.services.data_version import DataVersionTracker
+from server.services.entity_extractor import init_extraction_worker, load_spacy_model
+from server.services.extract_batcher import ExtractBatcher
+from server.services.image_cache import ImageResultCache
+from server.services.job_store import JobStore
+from server.services.match_batcher import MatchBatcher
+from server.services.normalization import result_keys
+from server.services.ocr_processor import init_ocr_worker
+from server.services.results_snapshot import SnapshotStore
+from server.services.single_flight import SingleFlight
+from server.services.source_cache import source_cache
+from server.services.verification_pipeline import VerificationPipeline
+from server.services.verification_writer import VerificationWriter
+from server.services.worker_pool import WorkerPool
 
 settings = Settings()
 
@@ -14,13 +31,96 @@ settings = Settings()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: load spaCy model
-    import spacy
+    app.state.nlp = load_spacy_model()
+
+    # Entity extraction runs off the event loop on a bounded pool
+    app.state.nlp_pool = WorkerPool(
+        "nlp",
+        kind=settings.nlp_executor,
+        max_workers=settings.nlp_workers,
+        max_queue=settings.nlp_max_queue,
+        timeout=settings.nlp_timeout_seconds,
+        initializer=init_extraction_worker if settings.nlp_executor == "process" else None,
+    )
+
+    # Optional cross-request batching of extraction through nlp.pipe
+    app.state.extract_batcher = None
+    if settings.nlp_batch_window_ms > 0:
+        app.state.extract_batcher = ExtractBatcher(
+            app.state.nlp,
+            app.state.nlp_pool,
+            window_ms=settings.nlp_batch_window_ms,
+            max_batch=settings.nlp_batch_max_size,
+        )
+
+    # OCR is CPU-heavy: one process per core, with a bounded admission queue
+    app.state.ocr_pool = WorkerPool(
+        "ocr",
+        kind="process",
+        max_workers=settings.ocr_workers,
+        max_queue=settings.ocr_max_queue,
+        timeout=settings.ocr_timeout_seconds,
+        initializer=init_ocr_worker,
+        initargs=(settings.tesseract_cmd, settings.ocr_backend, settings.tessdata_path),
+    )
+
+    # Verification response cache (in-process L1 + Redis L2) with
+    # single-flight on misses
+    app.state.cache = CacheService(
+        settings.redis_url,
+        l1_max_entries=settings.cache_l1_max_entries,
+        l1_ttl_seconds=settings.cache_l1_ttl_seconds,
+    )
+    app.state.single_flight = SingleFlight()
+    app.state.data_version = DataVersionTracker(settings.data_version_ttl_seconds)
+
+    # Official results held in memory for matching, rebuilt on data change
+    app.state.results_snapshot = SnapshotStore(app.state.data_version)
+
+    # SQL matcher: optional cross-request batching of lookups
+    app.state.match_batcher = None
+    if settings.matcher_backend != "snapshot" and settings.matcher_batch_window_ms > 0:
+        from server.db.session import AsyncSessionLocal
 
-    try:
-        app.state.nlp = spacy.load("en_core_web_sm")
-    except OSError:
-        print("WARNING: en_core_web_sm not found, using blank model. Run: python -m spacy download en_core_web_sm")
-        app.state.nlp = spacy.blank("en")
+        app.state.match_batcher = MatchBatcher(
+            AsyncSessionLocal,
+            window_ms=settings.matcher_batch_window_ms,
+            max_batch=settings.matcher_batch_max_size,
+        )
+
+    # Repeated screenshots skip OCR, NER and matching
+    app.state.image_cache = ImageResultCache(
+        max_entries=settings.image_cache_max_entries,
+        ttl_seconds=settings.image_cache_ttl_seconds,
+        hamming_threshold=settings.image_cache_hamming_threshold,
+    )
+
+    # Claim verification records are batched off the request path
+    from server.db.session import AsyncSessionLocal
+
+    app.state.verification_writer = VerificationWriter(
+        AsyncSessionLocal,
+        max_batch=settings.verification_flush_batch_size,
+        flush_interval=settings.verification_flush_interval_seconds,
+        max_pending=settings.verification_writer_max_pending,
+    )
+    app.state.verification_writer.start()
+
+    # Claim verification itself, independent of the HTTP request
+    app.state.pipeline = VerificationPipeline(
+        nlp=app.state.nlp,
+        nlp_pool=app.state.nlp_pool,
+        cache=app.state.cache,
+        single_flight=app.state.single_flight,
+        data_version=app.state.data_version,
+        results_snapshot=app.state.results_snapshot,
+        verification_writer=app.state.verification_writer,
+        match_batcher=app.state.match_batcher,
+        extract_batcher=app.state.extract_batcher,
+    )
+
+    # Async image jobs: status and results shared with the Celery workers
+    app.state.job_store = JobStore(settings.redis_url, settings.image_job_ttl_seconds)
 
     # Auto-create tables and seed on first startup
     try:
@@ -31,6 +131,14 @@ async def lifespan(app: FastAPI):
             await conn.run_sync(Base.metadata.create_all)
         print("Database tables ensured.")
 
+        # Hourly claim_verifications partitions for the next writes
+        from server.services.claim_partitions import ensure_partitions
+
+        async with AsyncSessionLocal() as db:
+            await ensure_partitions(
+                db, settings.claim_retention_hours, settings.claim_partitions_ahead_hours
+            )
+
         # Auto-seed if empty or if seed data version has changed
         from sqlalchemy import select, func, delete
         from server.db.session import AsyncSessionLocal
@@ -54,15 +162,29 @@ async def lifespan(app: FastAPI):
                 db.add(source)
                 await db.flush()
                 for r in SEED_RESULTS:
-                    db.add(ElectionResult(source_id=source.id, **r))
+                    db.add(
+                        ElectionResult(
+                            source_id=source.id,
+                            **r,
+                            **result_keys(r["candidate_name"], r["district"], r["position"]),
+                        )
+                    )
+                await db.flush()
+                await refresh_contest_summaries(db)
                 await db.commit()
+                source_cache.invalidate()
+                contest_cache.invalidate()
                 print(f"Seeded {len(SEED_RESULTS)} election results (version: {SEED_SOURCE['content_hash']}).")
     except Exception as e:
         print(f"WARNING: Could not auto-setup database: {e}")
         print("The app will start but verification endpoints may not work until DB is ready.")
 
     yield
-    # Shutdown
+    # Shutdown: write out queued verifications before the pools go
+    await app.state.verification_writer.close()
+    await app.state.job_store.close()
+    app.state.nlp_pool.shutdown()
+    app.state.ocr_pool.shutdown()
 
 
 app = FastAPI(
@@ -83,6 +205,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Stop reading oversized image uploads as they stream in (allow some
+# headroom for multipart framing around the file itself)
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    limits={
+        path: settings.max_image_size_mb * 1024 * 1024 + 64 * 1024
+        for path in ("/api/verify/image", "/api/verify/image/jobs")
+    },
+)
+
 # API routes
 app.include_router(api_router, prefix="/api")
 
@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from sqlalchemy import (
+    DDL,
     Column,
     DateTime,
     Float,
@@ -9,9 +10,11 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    UniqueConstraint,
+    event,
     func,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import DeclarativeBase, relationship
 
 
@@ -19,6 +22,14 @@ class Base(DeclarativeBase):
     pass
 
 
+# Trigram indexes below need pg_trgm; create it before the tables
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
 class OfficialSource(Base):
     __tablename__ = "official_sources"
 
@@ -38,6 +49,41 @@ class ElectionResult(Base):
     __table_args__ = (
         Index("ix_election_results_candidate_district", "candidate_name", "district"),
         Index("ix_election_results_district", "district"),
+        # Trigram indexes for similarity-ranked candidate retrieval
+        Index(
+            "ix_election_results_candidate_name_trgm",
+            "candidate_name",
+            postgresql_using="gin",
+            postgresql_ops={"candidate_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_election_results_district_trgm",
+            "district",
+            postgresql_using="gin",
+            postgresql_ops={"district": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_election_results_position_trgm",
+            "position",
+            postgresql_using="gin",
+            postgresql_ops={"position": "gin_trgm_ops"},
+        ),
+        # Normalized keys for exact matching (see services/normalization.py)
+        Index("ix_election_results_surname_key", "surname_key"),
+        Index("ix_election_results_district_key", "district_key"),
+        Index("ix_election_results_position_key", "position_key"),
+        # One race: see services/contests.py
+        Index(
+            "ix_election_results_contest",
+            "election_year",
+            "position_key",
+            "district_key",
+        ),
+        Index(
+            "ix_election_results_name_phonetics",
+            "name_phonetics",
+            postgresql_using="gin",
+        ),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -54,17 +100,70 @@ class ElectionResult(Base):
     percentage = Column(Float, nullable=True)
     total_valid_votes = Column(Integer, nullable=True)
     is_winner = Column(Integer, default=0)
+    # Lowercase, diacritic- and punctuation-free forms set at ingest
+    name_key = Column(String(255), nullable=True)
+    surname_key = Column(String(100), nullable=True)
+    district_key = Column(String(255), nullable=True)
+    position_key = Column(String(255), nullable=True)
+    # Phonetic key per name token (normalization.phonetic_keys)
+    name_phonetics = Column(ARRAY(String(64)), nullable=True)
     last_updated = Column(DateTime, server_default=func.now())
     created_at = Column(DateTime, server_default=func.now())
 
     source = relationship("OfficialSource", back_populates="results")
 
 
+class ContestSummary(Base):
+    """
+    Per-contest aggregates (services/contests.py), refreshed at ingest for
+    every contest a load touches. Keyed by ContestKey.id.
+    """
+
+    __tablename__ = "contest_summaries"
+
+    contest_key = Column(String(512), primary_key=True)
+    election_year = Column(Integer, nullable=False)
+    position_key = Column(String(255), nullable=False)
+    district_key = Column(String(255), nullable=False)
+    constituency_key = Column(String(255), nullable=False, default="")
+    polling_station_key = Column(String(255), nullable=False, default="")
+    # Not foreign keys: reseeding replaces results before summaries refresh
+    winner_result_id = Column(Integer, nullable=True)
+    runner_up_result_id = Column(Integer, nullable=True)
+    margin = Column(Integer, nullable=True)
+    total_votes = Column(Integer, nullable=False, default=0)
+    total_valid_votes = Column(Integer, nullable=False, default=0)
+    candidate_count = Column(Integer, nullable=False, default=0)
+    # Every candidate by rank: result_id, candidate_name, party,
+    # vote_count, rank, share, is_winner
+    standings = Column(JSONB, nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
 class ClaimVerification(Base):
+    """
+    Range-partitioned by hour on expires_at (services/claim_partitions.py);
+    retention drops whole partitions. The primary key and unique key carry
+    expires_at because Postgres requires the partition key in both.
+    """
+
     __tablename__ = "claim_verifications"
-    __table_args__ = (Index("ix_claim_verifications_expires_at", "expires_at"),)
+    __table_args__ = (
+        Index("ix_claim_verifications_expires_at", "expires_at"),
+        # One row per distinct claim per official-data version per expiry hour
+        UniqueConstraint(
+            "fingerprint",
+            "data_version",
+            "expires_at",
+            name="uq_claim_verifications_fingerprint_version_expiry",
+        ),
+        {"postgresql_partition_by": "RANGE (expires_at)"},
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
+    # sha256 of claim type + normalized claim text
+    fingerprint = Column(String(64), nullable=False)
+    data_version = Column(String(64), nullable=False, default="")
     claim_text = Column(Text, nullable=False)
     claim_type = Column(String(50), nullable=False)
     extracted_text = Column(Text, nullable=True)
@@ -76,5 +175,20 @@ class ClaimVerification(Base):
     confidence = Column(Float, nullable=False)
     explanation = Column(Text, nullable=True)
     ip_hash = Column(String(64), nullable=True)
+    # First and most recent request for the claim; expires_at is
+    # last_seen + the retention window, rounded down to the hour
     verified_at = Column(DateTime, server_default=func.now())
-    expires_at = Column(DateTime, nullable=False)
+    last_seen = Column(DateTime, server_default=func.now())
+    hit_count = Column(Integer, nullable=False, default=1)
+    expires_at = Column(DateTime, primary_key=True, nullable=False)
+
+
+# Catch-all partition for rows outside the pre-created hourly range
+event.listen(
+    ClaimVerification.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS claim_verifications_default "
+        "PARTITION OF claim_verifications DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
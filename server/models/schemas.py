@@ -22,6 +22,9 @@ class ExtractedFields(BaseModel):
     vote_count: Optional[int] = None
     percentage: Optional[float] = None
     result_claim: Optional[str] = None
+    candidate_names: list[str] = Field(default_factory=list)
+    margin: Optional[int] = None
+    claimed_rank: Optional[int] = None
 
 
 class OfficialDataResponse(BaseModel):
@@ -60,6 +63,29 @@ class ImageVerificationResponse(VerificationResponse):
     extracted_text: str
 
 
+# ── Async image jobs ──────────────────────────────────────────────────────
+
+
+class ImageJobResponse(BaseModel):
+    job_id: str
+    status: str
+    poll_url: str
+    events_url: str
+
+
+class JobError(BaseModel):
+    status_code: int
+    detail: str
+
+
+class ImageJobStatus(BaseModel):
+    job_id: str
+    # queued | processing | done | failed
+    status: str
+    result: Optional[ImageVerificationResponse] = None
+    error: Optional[JobError] = None
+
+
 # ── Other endpoints ───────────────────────────────────────────────────────
 
 
@@ -0,0 +1,76 @@
+import asyncio
+from typing import Any, Optional
+
+
+class Batcher:
+    """
+    Coalesce per-claim work from concurrent requests.
+
+    The first claim to arrive opens a window of window_ms; every claim
+    queued before it closes (or until max_batch is reached) is handled by
+    one _run_batch call, and each caller gets back its own result.
+    Subclasses implement _run_batch, returning results in input order.
+    """
+
+    def __init__(self, window_ms: float, max_batch: int = 64):
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._pending: list[tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+        self.batches = 0
+        self.claims = 0
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        # shield: one caller disconnecting must not cancel the shared batch
+        return await asyncio.shield(future)
+
+    async def _run_batch(self, items: list) -> list:
+        raise NotImplementedError
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._run(batch))
+        # Keep a reference so the task is not garbage-collected mid-flight
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[Any, asyncio.Future]]) -> None:
+        self.batches += 1
+        self.claims += len(batch)
+        try:
+            results = await self._run_batch([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+                    # Mark retrieved in case every caller has gone away
+                    future.exception()
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> dict:
+        return {
+            "window_ms": self.window * 1000,
+            "pending": len(self._pending),
+            "batches": self.batches,
+            "claims": self.claims,
+            "avg_batch_size": round(self.claims / self.batches, 2) if self.batches else 0,
+        }
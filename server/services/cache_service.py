@@ -1,52 +1,198 @@
 import hashlib
 import json
-from typing import Optional
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack is in requirements
+    msgpack = None
+
+# One-byte format tag in front of every Redis value
+_FORMAT_JSON = b"j"
+_FORMAT_MSGPACK = b"m"
+
+
+def _serialize(value: Any) -> bytes:
+    if msgpack is not None:
+        return _FORMAT_MSGPACK + msgpack.packb(value, default=str, use_bin_type=True)
+    return _FORMAT_JSON + json.dumps(value, default=str, separators=(",", ":")).encode()
+
+
+def _deserialize(data: bytes) -> Any:
+    tag, payload = data[:1], data[1:]
+    if tag == _FORMAT_MSGPACK and msgpack is not None:
+        return msgpack.unpackb(payload, raw=False)
+    if tag == _FORMAT_JSON:
+        return json.loads(payload)
+    # Values written before the format tag existed were plain JSON
+    return json.loads(data)
+
+
+class _LRUCache:
+    """Small in-process LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class _CircuitBreaker:
+    """
+    Skip Redis entirely after a failure, retrying with exponential backoff
+    (base_delay, 2x, 4x, ... capped at max_delay) until it answers again.
+    """
+
+    def __init__(self, base_delay: float = 1.0, max_delay: float = 60.0):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failures = 0
+        self._retry_at = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return self.failures > 0 and time.monotonic() < self._retry_at
+
+    def record_failure(self) -> None:
+        delay = min(self.base_delay * (2 ** self.failures), self.max_delay)
+        self.failures += 1
+        self._retry_at = time.monotonic() + delay
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._retry_at = 0.0
 
 
 class CacheService:
-    """Redis-backed cache for verification results."""
+    """
+    Two-tier cache for verification results: an in-process LRU (L1) in
+    front of Redis (L2). Redis is optional — with no REDIS_URL, or while
+    the circuit breaker is open, only L1 is used and no connection
+    attempts are made.
+    """
 
-    def __init__(self, redis_url: str):
+    def __init__(
+        self,
+        redis_url: str,
+        l1_max_entries: int = 4096,
+        l1_ttl_seconds: float = 60,
+        breaker_base_delay: float = 1.0,
+        breaker_max_delay: float = 60.0,
+    ):
         self._redis = None
         self._redis_url = redis_url
+        self._l1 = _LRUCache(l1_max_entries)
+        self._l1_ttl = l1_ttl_seconds
+        self._breaker = _CircuitBreaker(breaker_base_delay, breaker_max_delay)
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
 
     async def _get_redis(self):
+        if not self._redis_url or self._breaker.is_open:
+            return None
         if self._redis is None:
+            client = None
             try:
                 import redis.asyncio as aioredis
 
-                self._redis = aioredis.from_url(self._redis_url)
-                await self._redis.ping()
+                client = aioredis.from_url(
+                    self._redis_url,
+                    socket_connect_timeout=1,
+                    socket_timeout=1,
+                )
+                await client.ping()
+                self._redis = client
+                self._breaker.record_success()
             except Exception:
-                self._redis = None
+                await self._close(client)
+                self._breaker.record_failure()
         return self._redis
 
+    async def _on_redis_error(self) -> None:
+        # Drop the client so the next attempt (after backoff) reconnects
+        client, self._redis = self._redis, None
+        self._breaker.record_failure()
+        await self._close(client)
+
+    @staticmethod
+    async def _close(client) -> None:
+        """Release a client's connection pool; it is being discarded anyway."""
+        if client is None:
+            return
+        try:
+            await client.aclose()
+        except Exception:
+            pass
+
     def _key(self, claim_text: str) -> str:
         h = hashlib.sha256(claim_text.encode()).hexdigest()[:16]
         return f"yesveri:claim:{h}"
 
     async def get(self, claim_text: str) -> Optional[dict]:
+        key = self._key(claim_text)
+        value = self._l1.get(key)
+        if value is not None:
+            self.l1_hits += 1
+            return value
+
         r = await self._get_redis()
         if not r:
+            self.misses += 1
             return None
         try:
-            data = await r.get(self._key(claim_text))
-            return json.loads(data) if data else None
+            data = await r.get(key)
         except Exception:
+            await self._on_redis_error()
+            self.misses += 1
+            return None
+        if not data:
+            self.misses += 1
+            return None
+
+        try:
+            value = _deserialize(data)
+        except Exception as e:
+            # Corrupt or foreign value: recompute (and overwrite) it
+            print(f"WARNING: Could not decode cached value {key}: {e}")
+            self.misses += 1
             return None
+        self._l1.set(key, value, self._l1_ttl)
+        self.l2_hits += 1
+        return value
 
     async def set(self, claim_text: str, result: dict, ttl: int = 3600):
+        key = self._key(claim_text)
+        self._l1.set(key, result, min(ttl, self._l1_ttl))
+
         r = await self._get_redis()
         if not r:
             return
         try:
-            await r.setex(
-                self._key(claim_text),
-                ttl,
-                json.dumps(result, default=str),
-            )
+            await r.setex(key, ttl, _serialize(result))
         except Exception:
-            pass
+            await self._on_redis_error()
 
     async def is_healthy(self) -> bool:
         r = await self._get_redis()
@@ -56,4 +202,15 @@ class CacheService:
             await r.ping()
             return True
         except Exception:
+            await self._on_redis_error()
             return False
+
+    def stats(self) -> dict:
+        return {
+            "l1_entries": len(self._l1),
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+            "redis_circuit_open": self._breaker.is_open,
+            "redis_failures": self._breaker.failures,
+        }
@@ -0,0 +1,213 @@
+"""
+Vectorized candidate ranking over a columnar view of the results snapshot.
+
+The snapshot's hash indexes answer exact (and phonetic) token lookups; this
+module covers what they cannot — names misspelled beyond the phonetic
+rules — by scoring every row at once with NumPy instead of comparing rows
+one by one in Python. The score combines name edit distance and token
+overlap with district, position and party agreement, and the top-k rows
+come back with their score components so the matcher can explain the pick.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
+
+from server.services.normalization import (
+    canonical_district,
+    canonical_position,
+    normalize_text,
+    tokens,
+)
+
+# Component weights; components the claim has no value for are left out
+# and the remaining weights renormalized
+WEIGHTS = {
+    "name": 0.55,
+    "overlap": 0.15,
+    "district": 0.15,
+    "position": 0.10,
+    "party": 0.05,
+}
+
+# Vocabulary tokens that cannot reach this edit similarity to a claim token
+# are scored 0 instead of going through the edit-distance pass. Two cheap
+# upper bounds rule them out first: the length ratio, then the difference
+# in character counts (a lower bound on the edit distance).
+MIN_TOKEN_SIMILARITY = 0.5
+
+# Character -> count column: a-z, 0-9, then everything else
+_CHAR_BUCKETS = np.full(256, 36, dtype=np.uint8)
+_CHAR_BUCKETS[np.frombuffer(b"abcdefghijklmnopqrstuvwxyz0123456789", dtype=np.uint8)] = np.arange(36)
+
+
+def _char_counts(chars: np.ndarray) -> np.ndarray:
+    """Per-row character counts of a (rows x width) zero-padded byte matrix."""
+    counts = np.zeros((len(chars), 37), dtype=np.int16)
+    for column in chars.T:
+        present = column > 0
+        np.add.at(counts, (np.nonzero(present)[0], _CHAR_BUCKETS[column[present]]), 1)
+    return counts
+
+
+@dataclass(frozen=True)
+class RankedCandidate:
+    result: object
+    score: float
+    components: dict[str, float]
+
+
+def _edit_similarity(token: str, chars: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    1 - Levenshtein(token, v) / max(len(token), len(v)) for every
+    vocabulary entry v, computed one DP row at a time across the whole
+    vocabulary.
+    """
+    n_vocab, width = chars.shape
+    codes = np.frombuffer(token.encode("ascii", "ignore"), dtype=np.uint8)
+    if not len(codes) or not n_vocab:
+        return np.zeros(n_vocab)
+
+    offsets = np.arange(width + 1)
+    prev = np.broadcast_to(offsets, (n_vocab, width + 1))
+    for i, code in enumerate(codes, start=1):
+        cost = chars != code
+        # Deletion and substitution depend only on the previous row...
+        best = np.empty_like(prev)
+        best[:, 0] = i
+        best[:, 1:] = np.minimum(prev[:, 1:] + 1, prev[:, :-1] + cost)
+        # ...insertion chains along the row: cur[j] = min_k(best[k] + j - k)
+        prev = np.minimum.accumulate(best - offsets, axis=1) + offsets
+
+    distance = prev[np.arange(n_vocab), lengths]
+    return 1.0 - distance / np.maximum(lengths, len(codes))
+
+
+def _codes(values: list[str]) -> tuple[np.ndarray, dict[str, int]]:
+    lookup: dict[str, int] = {}
+    codes = np.array([lookup.setdefault(v, len(lookup)) if v else -1 for v in values], dtype=np.int32)
+    return codes, lookup
+
+
+class CandidateRanker:
+    """Columnar (array-per-field) view of the results for batch scoring."""
+
+    def __init__(self, results: Iterable):
+        self.results = tuple(results)
+        n_rows = len(self.results)
+
+        # Name tokens: a vocabulary plus a padded (rows x tokens) id matrix
+        row_tokens = [tokens(r.candidate_name) for r in self.results]
+        vocab = sorted({t for ts in row_tokens for t in ts})
+        vocab_ids = {t: i for i, t in enumerate(vocab)}
+        max_tokens = max((len(ts) for ts in row_tokens), default=0)
+        self._token_matrix = np.full((n_rows, max(max_tokens, 1)), -1, dtype=np.int32)
+        for row, ts in enumerate(row_tokens):
+            self._token_matrix[row, : len(ts)] = [vocab_ids[t] for t in ts]
+
+        width = max((len(t) for t in vocab), default=0)
+        self._vocab_chars = np.zeros((len(vocab), width), dtype=np.uint8)
+        for i, t in enumerate(vocab):
+            self._vocab_chars[i, : len(t)] = np.frombuffer(t.encode("ascii", "ignore"), dtype=np.uint8)
+        self._vocab_lengths = np.array([len(t) for t in vocab], dtype=np.int32)
+        self._vocab_ids = vocab_ids
+        self._vocab_counts = _char_counts(self._vocab_chars)
+        # Vocabulary ids by token length, to select a length band by bisection
+        self._by_length = np.argsort(self._vocab_lengths, kind="stable")
+        self._sorted_lengths = self._vocab_lengths[self._by_length]
+
+        self._ids = np.array([r.id for r in self.results], dtype=np.int64)
+        self._district, self._district_codes = _codes([canonical_district(r.district) for r in self.results])
+        self._position, self._position_codes = _codes([canonical_position(r.position) for r in self.results])
+        self._party, self._party_codes = _codes([normalize_text(r.party) for r in self.results])
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def _name_scores(self, name: str) -> tuple[np.ndarray, np.ndarray]:
+        """Mean best edit similarity and exact-token overlap per row."""
+        claim_tokens = tokens(name)
+        n_rows = len(self.results)
+        if not claim_tokens or not n_rows:
+            return np.zeros(n_rows), np.zeros(n_rows)
+
+        padding = self._token_matrix < 0
+        similarity = np.zeros(n_rows)
+        overlap = np.zeros(n_rows)
+        for token in claim_tokens:
+            vocab_similarity = self._token_similarity(token)
+            per_token = np.where(padding, 0.0, vocab_similarity[self._token_matrix])
+            similarity += per_token.max(axis=1)
+
+            token_id = self._vocab_ids.get(token)
+            if token_id is not None:
+                overlap += (self._token_matrix == token_id).any(axis=1)
+        return similarity / len(claim_tokens), overlap / len(claim_tokens)
+
+    def _token_similarity(self, token: str) -> np.ndarray:
+        """
+        Edit similarity of token to every vocabulary entry, computed only
+        for entries that could reach MIN_TOKEN_SIMILARITY (the rest are 0).
+        """
+        similarity = np.zeros(len(self._vocab_lengths))
+        codes = np.frombuffer(token.encode("ascii", "ignore"), dtype=np.uint8)
+        if not len(codes):
+            return similarity
+
+        # Length band: similarity <= shorter / longer
+        shortest = int(np.ceil(len(codes) * MIN_TOKEN_SIMILARITY))
+        longest = int(len(codes) / MIN_TOKEN_SIMILARITY)
+        band = self._by_length[
+            np.searchsorted(self._sorted_lengths, shortest, side="left"):
+            np.searchsorted(self._sorted_lengths, longest, side="right")
+        ]
+
+        # Character counts: every surplus or missing character costs an edit
+        diff = self._vocab_counts[band] - _char_counts(codes[None, :])[0]
+        min_distance = np.maximum(np.clip(diff, 0, None).sum(axis=1), np.clip(-diff, 0, None).sum(axis=1))
+        lengths = self._vocab_lengths[band]
+        band = band[1 - min_distance / np.maximum(lengths, len(codes)) >= MIN_TOKEN_SIMILARITY]
+
+        if len(band):
+            similarity[band] = _edit_similarity(
+                token, self._vocab_chars[band, :longest], self._vocab_lengths[band]
+            )
+        return similarity
+
+    @staticmethod
+    def _agreement(codes: np.ndarray, lookup: dict[str, int], value: str) -> np.ndarray:
+        return (codes == lookup.get(value, -2)).astype(float)
+
+    def rank(self, extracted: dict, k: int = 5) -> list[RankedCandidate]:
+        """Top-k rows for a claim, best first (ties broken by lowest id)."""
+        if not extracted.get("candidate_name") or not self.results:
+            return []
+
+        name, overlap = self._name_scores(extracted["candidate_name"])
+        components = {"name": name, "overlap": overlap}
+        if extracted.get("district"):
+            components["district"] = self._agreement(
+                self._district, self._district_codes, canonical_district(extracted["district"])
+            )
+        if extracted.get("position"):
+            components["position"] = self._agreement(
+                self._position, self._position_codes, canonical_position(extracted["position"])
+            )
+        if extracted.get("party"):
+            components["party"] = self._agreement(
+                self._party, self._party_codes, normalize_text(extracted["party"])
+            )
+
+        total_weight = sum(WEIGHTS[c] for c in components)
+        score = sum(WEIGHTS[c] * values for c, values in components.items()) / total_weight
+
+        top = np.lexsort((self._ids, -score))[:k]
+        return [
+            RankedCandidate(
+                result=self.results[i],
+                score=round(float(score[i]), 4),
+                components={c: round(float(values[i]), 4) for c, values in components.items()},
+            )
+            for i in top
+        ]
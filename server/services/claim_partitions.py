@@ -0,0 +1,136 @@
+"""
+Hourly range partitions of claim_verifications on expires_at.
+
+Every row's expires_at is its last hit + the retention window rounded DOWN
+to the hour (expiry_for), so partition [S, S + 1h) holds only rows that
+expire at S — at most the retention window after they were last seen. Once
+S has passed the whole partition is expired and retention drops it as a
+table: a metadata-only operation however many rows it holds, with no row
+deletes, dead tuples or vacuum work on the hot insert table.
+
+Partitions are created ahead of the rows that will land in them (at startup
+and by the hourly Celery task); anything outside the pre-created range goes
+to the DEFAULT partition, which CleanupService trims with row deletes.
+"""
+
+import re
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+TABLE = "claim_verifications"
+DEFAULT_PARTITION = "claim_verifications_default"
+PARTITION_PREFIX = "claim_verifications_p"
+_PARTITION_NAME = re.compile(rf"^{PARTITION_PREFIX}(\d{{10}})$")
+PARTITION_SPAN = timedelta(hours=1)
+
+# Fail a drop quickly instead of queueing behind (and blocking) inserts;
+# the next run retries
+DROP_LOCK_TIMEOUT = "2s"
+
+
+def floor_hour(ts: datetime) -> datetime:
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+
+def expiry_for(seen_at: datetime, retention_hours: int) -> datetime:
+    """expires_at for a row last seen at seen_at (never later than the window)."""
+    return floor_hour(seen_at + timedelta(hours=retention_hours))
+
+
+def partition_name(start: datetime) -> str:
+    return f"{PARTITION_PREFIX}{start:%Y%m%d%H}"
+
+
+def partition_ddl(start: datetime) -> str:
+    end = start + PARTITION_SPAN
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(start)} PARTITION OF {TABLE} "
+        f"FOR VALUES FROM ('{start:%Y-%m-%d %H:%M:%S}') TO ('{end:%Y-%m-%d %H:%M:%S}')"
+    )
+
+
+def partition_starts(now: datetime, retention_hours: int, ahead_hours: int) -> list[datetime]:
+    """Partitions rows written from now until ahead_hours from now will need."""
+    first = expiry_for(now, retention_hours)
+    return [first + i * PARTITION_SPAN for i in range(ahead_hours + 1)]
+
+
+async def is_partitioned(db: AsyncSession) -> bool:
+    """False until migration 0007 has converted an existing table."""
+    row = await db.execute(
+        text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass(:table))"
+        ),
+        {"table": TABLE},
+    )
+    return bool(row.scalar())
+
+
+async def list_partitions(db: AsyncSession) -> dict[str, datetime]:
+    """Hourly partitions by name -> range start (the DEFAULT partition excluded)."""
+    rows = await db.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:table)"
+        ),
+        {"table": TABLE},
+    )
+    partitions = {}
+    for (name,) in rows:
+        match = _PARTITION_NAME.match(name)
+        if match:
+            partitions[name] = datetime.strptime(match.group(1), "%Y%m%d%H")
+    return partitions
+
+
+async def ensure_partitions(
+    db: AsyncSession, retention_hours: int, ahead_hours: int, now: datetime | None = None
+) -> int:
+    """Create any missing partitions for the next ahead_hours. Returns partitions created."""
+    if not await is_partitioned(db):
+        return 0
+    now = now or datetime.utcnow()
+    existing = await list_partitions(db)
+    created = 0
+    for start in partition_starts(now, retention_hours, ahead_hours):
+        if partition_name(start) in existing:
+            continue
+        try:
+            await db.execute(text(partition_ddl(start)))
+            await db.commit()
+            created += 1
+        except Exception as e:
+            # e.g. the DEFAULT partition already holds rows for this hour
+            await db.rollback()
+            print(f"WARNING: Could not create partition {partition_name(start)}: {e}")
+    return created
+
+
+async def drop_expired_partitions(db: AsyncSession, now: datetime | None = None) -> list[str]:
+    """
+    Drop every hourly partition whose rows have all expired. Returns the
+    names dropped.
+
+    DROP TABLE takes an ACCESS EXCLUSIVE lock on the parent, bounded by
+    DROP_LOCK_TIMEOUT. (DETACH ... CONCURRENTLY would avoid that lock, but
+    Postgres refuses it while the DEFAULT partition exists.)
+    """
+    now = now or datetime.utcnow()
+    dropped = []
+    for name, start in sorted((await list_partitions(db)).items(), key=lambda p: p[1]):
+        if start > now:
+            break
+        try:
+            await db.execute(text(f"SET LOCAL lock_timeout = '{DROP_LOCK_TIMEOUT}'"))
+            await db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+            await db.commit()
+            dropped.append(name)
+        except Exception as e:
+            await db.rollback()
+            print(f"WARNING: Could not drop partition {name}: {e}")
+    return dropped
+
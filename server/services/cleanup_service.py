@@ -1,18 +1,82 @@
+import asyncio
 from datetime import datetime
 
-from sqlalchemy import delete
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from server.models.database import ClaimVerification
+from server.services.claim_partitions import (
+    DEFAULT_PARTITION,
+    TABLE,
+    drop_expired_partitions,
+    is_partitioned,
+)
+
+# Print a progress line every this many chunks
+PROGRESS_EVERY = 10
 
 
 class CleanupService:
-    """Delete expired claim verification records."""
+    """
+    Delete expired claim verification records.
+
+    Expired hourly partitions are dropped outright. Rows that still need a
+    DELETE — the DEFAULT partition, or the whole table before it is
+    partitioned — are removed in one statement (mode "single") or, in mode
+    "chunked", batch_size rows at a time along the expires_at index, each
+    batch its own short transaction followed by a pause of sleep_seconds,
+    so a backlog never holds long locks or writes one huge WAL burst.
+    """
+
+    def __init__(self, mode: str = "single", batch_size: int = 5000, sleep_seconds: float = 0.0):
+        if mode not in ("single", "chunked"):
+            raise ValueError(f"Unknown cleanup mode: {mode}")
+        self.mode = mode
+        self.batch_size = batch_size
+        self.sleep_seconds = sleep_seconds
 
     async def delete_expired(self, db: AsyncSession) -> int:
+        """
+        Returns rows deleted by DELETE — rows in dropped partitions are not
+        counted.
+        """
         now = datetime.utcnow()
+        if await is_partitioned(db):
+            dropped = await drop_expired_partitions(db, now)
+            if dropped:
+                print(f"Dropped {len(dropped)} expired claim_verifications partitions")
+            table = DEFAULT_PARTITION
+        else:
+            table = TABLE
+
+        if self.mode == "chunked":
+            return await self._delete_chunked(db, table, now)
         result = await db.execute(
-            delete(ClaimVerification).where(ClaimVerification.expires_at < now)
+            text(f"DELETE FROM {table} WHERE expires_at < :now"), {"now": now}
         )
         await db.commit()
         return result.rowcount or 0
+
+    async def _delete_chunked(self, db: AsyncSession, table: str, now: datetime) -> int:
+        total = 0
+        batches = 0
+        while True:
+            result = await db.execute(
+                text(
+                    f"DELETE FROM {table} WHERE id IN ("
+                    f"SELECT id FROM {table} WHERE expires_at < :now "
+                    "ORDER BY expires_at LIMIT :limit)"
+                ),
+                {"now": now, "limit": self.batch_size},
+            )
+            await db.commit()
+            deleted = result.rowcount or 0
+            total += deleted
+            batches += 1
+            if deleted < self.batch_size:
+                break
+            if batches % PROGRESS_EVERY == 0:
+                print(f"Cleanup: {total} expired rows deleted from {table} so far ({batches} batches)")
+            await asyncio.sleep(self.sleep_seconds)
+        if total:
+            print(f"Cleanup: {total} expired rows deleted from {table} in {batches} batches")
+        return total
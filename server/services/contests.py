@@ -0,0 +1,342 @@
+"""
+Contests: every candidate of one race, loaded together.
+
+A contest is one election year + position + district + constituency (+
+polling station for station-level results). Comparative claims — "X beat
+Y", "won by 20,000 votes", "came second" — are checked against the whole
+contest in memory: ranks, margins and the winner come from one load.
+
+With the results snapshot, contests are grouped from rows already in
+memory. Otherwise ContestCache reads the contest's contest_summaries row by
+primary key (falling back to one indexed query over election_results) and
+keeps it until ingest invalidates it or the TTL lapses. Ingest keeps the
+summaries current with refresh_contest_summaries().
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from server.models.database import ContestSummary, ElectionResult
+from server.services.normalization import (
+    canonical_district,
+    canonical_position,
+    normalize_text,
+    phonetic_key,
+    tokens,
+)
+
+
+@dataclass(frozen=True)
+class ContestKey:
+    election_year: int
+    position: str
+    district: str
+    constituency: str
+    polling_station: str
+
+    @property
+    def id(self) -> str:
+        """Primary key of the contest's row in contest_summaries."""
+        return "|".join(
+            (
+                str(self.election_year),
+                self.position,
+                self.district,
+                self.constituency,
+                self.polling_station,
+            )
+        )
+
+    @classmethod
+    def of(cls, result: Any) -> "ContestKey":
+        return cls(
+            election_year=result.election_year,
+            position=canonical_position(result.position),
+            district=canonical_district(result.district),
+            constituency=normalize_text(result.constituency),
+            polling_station=normalize_text(result.polling_station),
+        )
+
+
+@dataclass(frozen=True)
+class Standing:
+    """One candidate's line in a contest summary."""
+
+    id: int
+    candidate_name: str
+    party: Optional[str]
+    vote_count: int
+    is_winner: int
+    total_valid_votes: Optional[int]
+
+
+class Contest:
+    """All rows of one race, ranked by votes (ties broken by lowest id)."""
+
+    def __init__(self, key: ContestKey, results: Iterable[Any]):
+        self.key = key
+        self.results = tuple(sorted(results, key=lambda r: (-(r.vote_count or 0), r.id)))
+        self._rank = {r.id: i for i, r in enumerate(self.results, start=1)}
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    @property
+    def winner(self) -> Optional[Any]:
+        return self.results[0] if self.results else None
+
+    @property
+    def runner_up(self) -> Optional[Any]:
+        return self.results[1] if len(self.results) > 1 else None
+
+    @property
+    def total_votes(self) -> int:
+        return sum(r.vote_count or 0 for r in self.results)
+
+    @property
+    def total_valid_votes(self) -> int:
+        """The official total where rows carry one, else the sum of votes."""
+        official = max((r.total_valid_votes or 0 for r in self.results), default=0)
+        return official or self.total_votes
+
+    @property
+    def winner_ids(self) -> frozenset[int]:
+        """Declared winners (is_winner), or the top row if none is flagged."""
+        flagged = frozenset(r.id for r in self.results if r.is_winner)
+        if flagged:
+            return flagged
+        return frozenset([self.results[0].id]) if self.results else frozenset()
+
+    def is_winner(self, result_id: int) -> bool:
+        return result_id in self.winner_ids
+
+    def share(self, result_id: int) -> Optional[float]:
+        """Percentage of valid votes, computed from the contest totals."""
+        rank = self.rank(result_id)
+        total = self.total_valid_votes
+        if rank is None or not total:
+            return None
+        return round(100 * (self.results[rank - 1].vote_count or 0) / total, 2)
+
+    def rank(self, result_id: int) -> Optional[int]:
+        return self._rank.get(result_id)
+
+    def margin(self, result_id: int) -> Optional[int]:
+        """
+        Votes ahead of the runner-up for the winner; votes behind the
+        winner (negative) for everyone else.
+        """
+        rank = self.rank(result_id)
+        if rank is None or len(self.results) < 2:
+            return None
+        votes = self.results[rank - 1].vote_count or 0
+        other = self.results[1] if rank == 1 else self.results[0]
+        return votes - (other.vote_count or 0)
+
+    def find_candidate(self, name: str) -> Optional[Any]:
+        """Row whose name contains every token of name (or, failing that, every phonetic key)."""
+        wanted = tokens(name)
+        if not wanted:
+            return None
+        for r in self.results:
+            if set(wanted) <= set(tokens(r.candidate_name)):
+                return r
+        wanted_keys = {phonetic_key(t) for t in wanted}
+        for r in self.results:
+            if wanted_keys <= {phonetic_key(t) for t in tokens(r.candidate_name)}:
+                return r
+        return None
+
+
+def group_contests(results: Iterable[Any]) -> dict[ContestKey, Contest]:
+    grouped: dict[ContestKey, list] = {}
+    for r in results:
+        grouped.setdefault(ContestKey.of(r), []).append(r)
+    return {key: Contest(key, rows) for key, rows in grouped.items()}
+
+
+# ── Summaries ───────────────────────────────────────────────────────
+
+
+def summary_values(contest: Contest) -> dict:
+    """contest_summaries column values for a contest."""
+    key = contest.key
+    winner_ids = contest.winner_ids
+    winner, runner_up = contest.winner, contest.runner_up
+    return {
+        "contest_key": key.id,
+        "election_year": key.election_year,
+        "position_key": key.position,
+        "district_key": key.district,
+        "constituency_key": key.constituency,
+        "polling_station_key": key.polling_station,
+        "winner_result_id": winner.id if winner else None,
+        "runner_up_result_id": runner_up.id if runner_up else None,
+        "margin": contest.margin(winner.id) if winner else None,
+        "total_votes": contest.total_votes,
+        "total_valid_votes": contest.total_valid_votes,
+        "candidate_count": len(contest),
+        "standings": [
+            {
+                "result_id": r.id,
+                "candidate_name": r.candidate_name,
+                "party": r.party,
+                "vote_count": r.vote_count or 0,
+                "rank": rank,
+                "share": contest.share(r.id),
+                "is_winner": int(r.id in winner_ids),
+            }
+            for rank, r in enumerate(contest.results, start=1)
+        ],
+    }
+
+
+def contest_from_summary(key: ContestKey, summary: ContestSummary) -> Contest:
+    return Contest(
+        key,
+        [
+            Standing(
+                id=s["result_id"],
+                candidate_name=s["candidate_name"],
+                party=s["party"],
+                vote_count=s["vote_count"],
+                is_winner=s["is_winner"],
+                total_valid_votes=summary.total_valid_votes,
+            )
+            for s in summary.standings
+        ],
+    )
+
+
+async def refresh_contest_summaries(
+    db: AsyncSession, keys: Optional[Iterable[ContestKey]] = None
+) -> int:
+    """
+    Recompute contest_summaries for the given contests (all when keys is
+    None) from election_results, deleting summaries of contests that no
+    longer have rows. The caller commits. Returns contests written.
+    """
+    query = select(ElectionResult)
+    if keys is not None:
+        keys = set(keys)
+        if not keys:
+            return 0
+        query = query.where(
+            tuple_(
+                ElectionResult.election_year,
+                ElectionResult.position_key,
+                ElectionResult.district_key,
+            ).in_({(k.election_year, k.position, k.district) for k in keys})
+        )
+    rows = await db.execute(query)
+    contests = group_contests(rows.scalars().all())
+    if keys is not None:
+        contests = {k: c for k, c in contests.items() if k in keys}
+
+    for contest in contests.values():
+        values = summary_values(contest)
+        stmt = insert(ContestSummary).values(**values)
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[ContestSummary.contest_key],
+                set_={name: stmt.excluded[name] for name in values if name != "contest_key"},
+            )
+        )
+
+    live = [k.id for k in contests]
+    if keys is None:
+        await db.execute(delete(ContestSummary).where(ContestSummary.contest_key.notin_(live)))
+    else:
+        gone = [k.id for k in keys if k not in contests]
+        if gone:
+            await db.execute(delete(ContestSummary).where(ContestSummary.contest_key.in_(gone)))
+    return len(contests)
+
+
+class ContestCache:
+    def __init__(self, ttl_seconds: float = 30):
+        self.ttl_seconds = ttl_seconds
+        self._contests: dict[ContestKey, tuple[float, Contest]] = {}
+
+    async def get(self, result: Any, db: AsyncSession) -> Contest:
+        """The contest a matched result belongs to."""
+        return (await self.get_many([result], db))[result.id]
+
+    async def get_many(self, results: Iterable[Any], db: AsyncSession) -> dict[int, Contest]:
+        """
+        Contests of many matched results, by result id. Uncached contests
+        load together: one contest_summaries query, plus one query over
+        election_results for any without a usable summary.
+        """
+        contests: dict[int, Contest] = {}
+        missing: dict[ContestKey, list] = {}
+        for result in results:
+            key = ContestKey.of(result)
+            cached = self._contests.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self.ttl_seconds:
+                contests[result.id] = cached[1]
+            else:
+                missing.setdefault(key, []).append(result)
+        if not missing:
+            return contests
+
+        rows = await db.execute(
+            select(ContestSummary).where(ContestSummary.contest_key.in_([k.id for k in missing]))
+        )
+        summaries = {s.contest_key: s for s in rows.scalars().all()}
+        unsummarized: dict[ContestKey, list] = {}
+        for key, matched in missing.items():
+            summary = summaries.get(key.id)
+            listed = {s["result_id"] for s in summary.standings} if summary is not None else set()
+            if summary is not None and all(r.id in listed for r in matched):
+                self._store(key, contest_from_summary(key, summary), matched, contests)
+            else:
+                unsummarized[key] = matched
+        if not unsummarized:
+            return contests
+
+        # No summary yet (ingest predates the table): narrow on the indexed year/position/district keys, then finish
+        # grouping in Python with the same keys the snapshot uses
+        rows = await db.execute(
+            select(ElectionResult)
+            .options(joinedload(ElectionResult.source))
+            .where(
+                tuple_(
+                    ElectionResult.election_year,
+                    ElectionResult.position_key,
+                    ElectionResult.district_key,
+                ).in_({(k.election_year, k.position, k.district) for k in unsummarized})
+            )
+        )
+        grouped: dict[ContestKey, list] = {}
+        for r in rows.scalars().all():
+            grouped.setdefault(ContestKey.of(r), []).append(r)
+        for key, matched in unsummarized.items():
+            members = grouped.get(key, [])
+            loaded = {r.id for r in members}
+            # Rows that predate the key columns (not yet backfilled)
+            members += {r.id: r for r in matched if r.id not in loaded}.values()
+            self._store(key, Contest(key, members), matched, contests)
+        return contests
+
+    def _store(
+        self, key: ContestKey, contest: Contest, matched: list, contests: dict[int, Contest]
+    ) -> None:
+        self._contests[key] = (time.monotonic(), contest)
+        for r in matched:
+            contests[r.id] = contest
+
+    def invalidate(self) -> None:
+        self._contests = {}
+
+    def stats(self) -> dict:
+        return {"contests": len(self._contests)}
+
+
+contest_cache = ContestCache()
@@ -0,0 +1,52 @@
+import hashlib
+import time
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.models.database import ElectionResult, OfficialSource
+
+
+class DataVersionTracker:
+    """
+    Fingerprint of the official dataset, used to key caches so they turn
+    over whenever the scraper or seed changes the data.
+
+    Ingest runs in other processes (Celery, seed script), so the version is
+    re-read from the database at most once per ttl_seconds rather than
+    relying on in-process invalidation alone.
+    """
+
+    def __init__(self, ttl_seconds: float = 30):
+        self.ttl_seconds = ttl_seconds
+        self._version: Optional[str] = None
+        self._checked_at = 0.0
+
+    async def current(self, db: AsyncSession) -> str:
+        if self._version is not None and time.monotonic() - self._checked_at < self.ttl_seconds:
+            return self._version
+
+        sources = await db.execute(
+            select(
+                OfficialSource.id,
+                OfficialSource.content_hash,
+                OfficialSource.last_scraped,
+            ).order_by(OfficialSource.id)
+        )
+        results = await db.execute(
+            select(
+                func.count(ElectionResult.id),
+                func.max(ElectionResult.id),
+                func.max(ElectionResult.last_updated),
+            )
+        )
+        fingerprint = repr((sources.all(), tuple(results.one())))
+
+        self._version = hashlib.sha256(fingerprint.encode()).hexdigest()[:16]
+        self._checked_at = time.monotonic()
+        return self._version
+
+    def invalidate(self) -> None:
+        """Force the next call to re-read the version (after local ingest)."""
+        self._version = None
@@ -1,10 +1,62 @@
+import asyncio
+import operator
+from functools import reduce
 from typing import Any, Optional
 
-from sqlalchemy import and_, select
+from sqlalchemy import (
+    Integer,
+    String,
+    and_,
+    case,
+    cast,
+    column,
+    func,
+    literal,
+    or_,
+    select,
+    true,
+    union_all,
+    values,
+)
+from sqlalchemy.dialects.postgresql import array
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
-from server.models.database import ElectionResult, OfficialSource
+from server.models.database import ElectionResult
 from server.models.enums import AlignmentStatus
+from server.services.contests import Contest, contest_cache
+from server.services.normalization import (
+    canonical_district,
+    canonical_position,
+    phonetic_key,
+    surname_key,
+    tokens,
+)
+from server.services.results_snapshot import ResultsSnapshot
+from server.services.source_cache import SourceRecord, source_cache
+
+
+# Claim fields used for matching, most specific first
+MATCH_FIELDS = ("candidate_name", "district", "position", "party")
+
+# Snapshot fallback when the indexes find nothing: the ranker's best row is
+# accepted if its name is at least this similar to the claim
+RANK_MIN_NAME_SIMILARITY = 0.75
+RANK_TOP_K = 5
+
+# Result keywords placing the claim's subject ahead of / behind the other
+# candidate named in a comparative claim
+AHEAD_WORDS = {"won", "wins", "winning", "beat", "beats", "beating", "defeated", "leading", "leads"}
+BEHIND_WORDS = {"lost", "loses", "losing"}
+WIN_LOSS_WORDS = {"won", "wins", "winning", "elected", "lost", "loses", "losing", "defeated"}
+
+# Claim field -> (normalized ElectionResult column, key function applied to
+# the claim value). Party has no key and is matched by trigram only.
+KEY_COLUMNS = {
+    "candidate_name": ("surname_key", surname_key),
+    "district": ("district_key", canonical_district),
+    "position": ("position_key", canonical_position),
+}
 
 
 class MatchResult:
@@ -15,80 +67,225 @@ class MatchResult:
         source: Optional[Any] = None,
         confidence: float = 0.0,
         conflicts: Optional[list] = None,
+        relaxation_level: int = 0,
+        candidates: Optional[list] = None,
     ):
         self.alignment = alignment
         self.official_result = official_result
         self.source = source
         self.confidence = confidence
         self.conflicts = conflicts or []
+        # 0 = matched on every criterion; each step up dropped criteria
+        self.relaxation_level = relaxation_level
+        # Ranked alternatives (RankedCandidate) when the fuzzy ranker chose
+        self.candidates = candidates or []
 
 
 class DeterministicMatcher:
-    """Compare extracted entities against official EC data."""
+    """
+    Compare extracted entities against official EC data.
 
-    async def match(self, extracted: dict, db: AsyncSession) -> MatchResult:
-        # Build query filters based on what was extracted
-        filters = []
+    With a ResultsSnapshot the lookup is served from in-memory indexes;
+    without one it falls back to querying the database.
+    """
+
+    def __init__(self, snapshot: Optional[ResultsSnapshot] = None):
+        self.snapshot = snapshot
+
+    def _criteria(self, extracted: dict) -> list[tuple[str, str]]:
+        """(field, value) pairs to match on, most specific first."""
+        criteria = []
 
         if extracted.get("candidate_name"):
-            # Use ILIKE for fuzzy matching
-            name = extracted["candidate_name"]
-            # Try matching against any part of the candidate name
-            filters.append(
-                ElectionResult.candidate_name.ilike(f"%{name.split()[-1]}%")
-            )
+            # Match on the surname: any part of the official name
+            criteria.append(("candidate_name", extracted["candidate_name"].split()[-1]))
 
         if extracted.get("district"):
-            filters.append(
-                ElectionResult.district.ilike(f"%{extracted['district']}%")
-            )
+            criteria.append(("district", extracted["district"]))
 
         if extracted.get("position"):
-            pos = extracted["position"]
-            # Normalize MP variants
-            if pos in ("MP", "Member of Parliament"):
-                filters.append(
-                    ElectionResult.position.ilike("%Member of Parliament%")
-                    | ElectionResult.position.ilike("%MP%")
-                )
-            else:
-                filters.append(ElectionResult.position.ilike(f"%{pos}%"))
+            criteria.append(("position", extracted["position"]))
 
         if extracted.get("party"):
-            filters.append(ElectionResult.party.ilike(f"%{extracted['party']}%"))
+            criteria.append(("party", extracted["party"]))
+
+        return criteria
+
+    def _sql_value(self, field: str, value: str) -> str:
+        # Normalize MP variants
+        if field == "position" and value in ("MP", "Member of Parliament"):
+            return "Member of Parliament"
+        return value
+
+    def _sql_key(self, field: str, value: str) -> Optional[str]:
+        if field not in KEY_COLUMNS:
+            return None
+        return KEY_COLUMNS[field][1](value)
+
+    def _sql_filter(self, field: str, value: str):
+        # Exact equality on the normalized key column (btree), falling back
+        # to pg_trgm word similarity ("value <% column") for misspellings
+        # like "Kyangulanyi", served by the GIN indexes
+        column = getattr(ElectionResult, field)
+        fuzzy = literal(self._sql_value(field, value)).op("<%")(column)
+        if field not in KEY_COLUMNS:
+            return fuzzy
+        key_column = getattr(ElectionResult, KEY_COLUMNS[field][0])
+        exact = key_column == self._sql_key(field, value)
+        if field == "candidate_name":
+            # Spelling variants ("Sentamu") via the phonetic key GIN index
+            phonetic = ElectionResult.name_phonetics.contains([phonetic_key(value)])
+            return or_(exact, phonetic, fuzzy)
+        return or_(exact, fuzzy)
+
+    def _sql_score(self, criteria: list[tuple[str, str]]):
+        """
+        Combined trigram similarity across all criteria, for ranking, plus
+        one point per exact key match so exact rows outrank fuzzy ones.
+        """
+        terms = []
+        for field, value in criteria:
+            terms.append(
+                func.word_similarity(
+                    self._sql_value(field, value), func.coalesce(getattr(ElectionResult, field), "")
+                )
+            )
+            if field in KEY_COLUMNS:
+                key_column = getattr(ElectionResult, KEY_COLUMNS[field][0])
+                terms.append(case((key_column == self._sql_key(field, value), 1.0), else_=0.0))
+        return reduce(operator.add, terms)
 
-        # If we have no meaningful filters, we cannot verify
-        if not filters:
+    async def match(self, extracted: dict, db: AsyncSession) -> MatchResult:
+        # Build match criteria based on what was extracted
+        criteria = self._criteria(extracted)
+
+        # If we have no meaningful criteria, we cannot verify
+        if not criteria:
             return MatchResult(
                 alignment=AlignmentStatus.CANNOT_VERIFY,
                 confidence=0.0,
             )
 
-        # Try with all filters first
-        result = await self._query_with_filters(filters, db)
+        # Best row under progressive relaxation: all criteria, then the
+        # first two (candidate + district), then the first alone
+        result, relaxation_level = await self._find_best(criteria, db)
+        candidates = []
+        if result is None:
+            result, relaxation_level, candidates = await self._rank_fallback(extracted, criteria)
+        return await self._build_result(extracted, result, relaxation_level, db, candidates)
+
+    async def match_many(
+        self, extracted_list: list[dict], db: AsyncSession
+    ) -> list[MatchResult]:
+        """
+        Match many extracted claims with a constant number of queries
+        (one, on the SQL backend; none with a snapshot). Results come back
+        in input order with the same semantics as match().
+        """
+        criteria_list = [self._criteria(extracted) for extracted in extracted_list]
 
-        if not result:
-            # Progressive relaxation: try with fewer filters
-            # Try candidate + district only
-            relaxed = [f for f in filters[:2]]
-            if len(relaxed) >= 1:
-                result = await self._query_with_filters(relaxed, db)
+        if self.snapshot is not None:
+            found = [
+                await self._find_best(criteria, db) if criteria else (None, 0)
+                for criteria in criteria_list
+            ]
+        else:
+            found = await self._query_scored_many(criteria_list, db)
+
+        picked = []
+        for extracted, criteria, (result, relaxation_level) in zip(
+            extracted_list, criteria_list, found
+        ):
+            candidates = []
+            if criteria and result is None:
+                result, relaxation_level, candidates = await self._rank_fallback(extracted, criteria)
+            picked.append((result, relaxation_level, candidates))
+
+        # Sources and contests for the whole batch up front, so building
+        # the results issues no per-claim queries
+        sources = None
+        if any(result is not None and result.source is None for result, _, _ in picked):
+            sources = await source_cache.all(db)
+        contests = await self._get_contests(
+            [
+                result
+                for extracted, (result, _, _) in zip(extracted_list, picked)
+                if result is not None and self._needs_contest(extracted)
+            ],
+            db,
+        )
 
-            # Try candidate only
-            if not result and filters:
-                result = await self._query_with_filters([filters[0]], db)
+        results = []
+        for extracted, criteria, (result, relaxation_level, candidates) in zip(
+            extracted_list, criteria_list, picked
+        ):
+            if not criteria:
+                results.append(
+                    MatchResult(alignment=AlignmentStatus.CANNOT_VERIFY, confidence=0.0)
+                )
+                continue
+            results.append(
+                await self._build_result(
+                    extracted, result, relaxation_level, db, candidates, sources, contests
+                )
+            )
+        return results
 
+    async def _rank_fallback(
+        self, extracted: dict, criteria: list[tuple[str, str]]
+    ) -> tuple[Optional[Any], int, list]:
+        """
+        Snapshot only: when no row matches the candidate's tokens, rank
+        every row with the vectorized scorer and accept the best one if
+        its name is close enough. Reported one level past the strictest
+        relaxation, with the ranked alternatives for the explanation.
+        Ranking runs in a thread so it does not block the event loop.
+        """
+        if self.snapshot is None or not extracted.get("candidate_name"):
+            return None, 0, []
+        ranked = await asyncio.to_thread(self.snapshot.ranker.rank, extracted, RANK_TOP_K)
+        if not ranked or ranked[0].components["name"] < RANK_MIN_NAME_SIMILARITY:
+            return None, 0, []
+        return ranked[0].result, len(self._relaxation_sizes(criteria)), ranked
+
+    async def _build_result(
+        self,
+        extracted: dict,
+        result: Optional[Any],
+        relaxation_level: int,
+        db: AsyncSession,
+        candidates: Optional[list] = None,
+        sources: Optional[dict[int, SourceRecord]] = None,
+        contests: Optional[dict[int, Contest]] = None,
+    ) -> MatchResult:
+        """sources and contests are match_many's prefetched lookups."""
         if not result:
             return MatchResult(
                 alignment=AlignmentStatus.NO_OFFICIAL_DATA,
                 confidence=0.3,
             )
 
-        # Get the source for this result
-        source = await self._get_source(result.source_id, db)
+        # Source is pre-joined in the snapshot and eager-loaded by the query
+        source = result.source
+        if source is None and sources is not None:
+            source = sources.get(result.source_id)
+        if source is None:
+            source = await self._get_source(result.source_id, db)
+
+        # Winner, share and comparative checks read the result's contest
+        contest = None
+        if self._needs_contest(extracted):
+            if contests is not None and result.id in contests:
+                contest = contests[result.id]
+            else:
+                contest = await self._get_contest(result, db)
+            if contest.rank(result.id) is None:
+                contest = None
 
         # Compare fields
-        conflicts = self._compare_fields(extracted, result)
+        conflicts = self._compare_fields(extracted, result, contest)
+        if contest is not None and self._is_comparative(extracted):
+            conflicts.extend(self._compare_contest(extracted, result, contest))
         confidence = self._calculate_confidence(extracted, result, conflicts)
 
         if conflicts:
@@ -102,24 +299,220 @@ class DeterministicMatcher:
             source=source,
             confidence=confidence,
             conflicts=conflicts,
+            relaxation_level=relaxation_level,
+            candidates=candidates,
+        )
+
+    def _relaxation_sizes(self, criteria: list[tuple[str, str]]) -> list[int]:
+        """Number of leading criteria required at each relaxation level."""
+        return sorted({len(criteria), min(2, len(criteria)), 1}, reverse=True)
+
+    async def _find_best(
+        self, criteria: list[tuple[str, str]], db: AsyncSession
+    ) -> tuple[Optional[Any], int]:
+        sizes = self._relaxation_sizes(criteria)
+        if self.snapshot is not None:
+            for level, size in enumerate(sizes):
+                result = self.snapshot.find(criteria[:size])
+                if result:
+                    return result, level
+            return None, 0
+        return await self._query_scored(criteria, sizes, db)
+
+    async def _query_scored(
+        self, criteria: list[tuple[str, str]], sizes: list[int], db: AsyncSession
+    ) -> tuple[Optional[ElectionResult], int]:
+        """
+        Progressive relaxation in a single round trip: every row matching
+        the first criterion is scored with CASE by the strictest level it
+        satisfies, then ranked by trigram similarity within the level.
+        """
+        filters = [self._sql_filter(field, value) for field, value in criteria]
+        relaxation_level = case(
+            *[(and_(*filters[:size]), level) for level, size in enumerate(sizes)],
+            else_=len(sizes),
+        ).label("relaxation_level")
+
+        query = (
+            select(ElectionResult, relaxation_level)
+            .options(joinedload(ElectionResult.source))
+            .where(filters[0])
+            .order_by(
+                relaxation_level,
+                self._sql_score(criteria).desc(),
+                ElectionResult.id,
+            )
+            .limit(1)
         )
+        rows = await db.execute(query)
+        row = rows.first()
+        if row is None:
+            return None, 0
+        return row[0], row[1]
+
+    async def _get_source(self, source_id: int, db: AsyncSession) -> Optional[SourceRecord]:
+        return await source_cache.get(source_id, db)
+
+    async def _get_contest(self, result: Any, db: AsyncSession) -> Contest:
+        if self.snapshot is not None:
+            return self.snapshot.contest(result)
+        return await contest_cache.get(result, db)
+
+    async def _get_contests(self, results: list[Any], db: AsyncSession) -> dict[int, Contest]:
+        """_get_contest for many results, by result id."""
+        if self.snapshot is not None:
+            return {result.id: self.snapshot.contest(result) for result in results}
+        if not results:
+            return {}
+        return await contest_cache.get_many(results, db)
+
+    async def _query_scored_many(
+        self, criteria_list: list[list[tuple[str, str]]], db: AsyncSession
+    ) -> list[tuple[Optional[ElectionResult], int]]:
+        """
+        The batched form of _query_scored: claims are sent as VALUES lists
+        and each picks its best row through a LATERAL subquery, so N claims
+        cost one round trip.
 
-    async def _query_with_filters(
-        self, filters: list, db: AsyncSession
-    ) -> Optional[ElectionResult]:
-        query = select(ElectionResult).where(and_(*filters)).limit(5)
+        Claims are grouped by their first criterion, one UNION ALL branch
+        per field, so each branch filters on a single column and can use
+        that column's key, phonetic and trigram indexes.
+        """
+        found: list[tuple[Optional[ElectionResult], int]] = [(None, 0)] * len(criteria_list)
+        rows_by_first_field: dict[str, list[tuple]] = {}
+        for idx, criteria in enumerate(criteria_list):
+            if not criteria:
+                continue
+            values_by_field = {
+                field: self._sql_value(field, value) for field, value in criteria
+            }
+            fields = [field for field, _ in criteria]
+            keys_by_field = {field: self._sql_key(field, value) for field, value in criteria}
+            rows_by_first_field.setdefault(fields[0], []).append(
+                (
+                    idx,
+                    *[values_by_field.get(field) for field in MATCH_FIELDS],
+                    *[keys_by_field.get(field) for field in KEY_COLUMNS],
+                    phonetic_key(values_by_field["candidate_name"])
+                    if "candidate_name" in values_by_field
+                    else None,
+                    fields[1] if len(fields) > 1 else None,
+                )
+            )
+        if not rows_by_first_field:
+            return found
+
+        branches = [
+            self._scored_branch(first_field, rows_data)
+            for first_field, rows_data in rows_by_first_field.items()
+        ]
+        best = (branches[0] if len(branches) == 1 else union_all(*branches)).subquery("best")
+        query = (
+            select(best.c.idx, best.c.all_ok, best.c.first_two_ok, ElectionResult)
+            .join(ElectionResult, ElectionResult.id == best.c.result_id)
+            .options(joinedload(ElectionResult.source))
+        )
         rows = await db.execute(query)
-        results = rows.scalars().all()
-        return results[0] if results else None
 
-    async def _get_source(
-        self, source_id: int, db: AsyncSession
-    ) -> Optional[OfficialSource]:
-        query = select(OfficialSource).where(OfficialSource.id == source_id)
-        row = await db.execute(query)
-        return row.scalar_one_or_none()
+        for idx, all_matched, first_two_matched, result in rows.all():
+            criteria = criteria_list[idx]
+            if all_matched:
+                size = len(criteria)
+            elif first_two_matched:
+                size = 2
+            else:
+                size = 1
+            found[idx] = (result, self._relaxation_sizes(criteria).index(size))
+        return found
+
+    def _scored_branch(self, first_field: str, rows_data: list[tuple]):
+        """
+        Best row for each claim whose first criterion is first_field: the
+        LATERAL filter is that field's match alone, the other criteria only
+        rank the rows it finds.
+        """
+        claims = values(
+            column("idx", Integer),
+            *[column(field, String) for field in MATCH_FIELDS],
+            *[column(f"{field}_key", String) for field in KEY_COLUMNS],
+            column("candidate_name_phonetic", String),
+            column("second_field", String),
+            name=f"claims_{first_field}",
+        ).data(rows_data)
+
+        # Per-field match: exact key, phonetic key (names) or trigram
+        fuzzy = {
+            field: claims.c[field].op("<%")(getattr(ElectionResult, field))
+            for field in MATCH_FIELDS
+        }
+        exact = {
+            field: getattr(ElectionResult, key_column) == claims.c[f"{field}_key"]
+            for field, (key_column, _) in KEY_COLUMNS.items()
+        }
+        # Cast, as a branch with no names has an all-NULL (text) column
+        phonetic = ElectionResult.name_phonetics.contains(
+            array([cast(claims.c.candidate_name_phonetic, String)])
+        )
+        matched = {
+            field: or_(exact[field], fuzzy[field]) if field in exact else fuzzy[field]
+            for field in MATCH_FIELDS
+        }
+        matched["candidate_name"] = or_(exact["candidate_name"], phonetic, fuzzy["candidate_name"])
+
+        # Every claim in the branch has first_field, so the filter needs no
+        # NULL guard; the other fields are only checked where the claim has them
+        first_two_ok = or_(
+            claims.c.second_field.is_(None),
+            *[
+                and_(claims.c.second_field == f, matched[f])
+                for f in MATCH_FIELDS
+                if f != first_field
+            ],
+        )
+        all_ok = and_(
+            *[
+                or_(claims.c[f].is_(None), matched[f])
+                for f in MATCH_FIELDS
+                if f != first_field
+            ]
+        )
+        score = reduce(
+            operator.add,
+            [
+                func.word_similarity(
+                    func.coalesce(claims.c[f], ""),
+                    func.coalesce(getattr(ElectionResult, f), ""),
+                )
+                for f in MATCH_FIELDS
+            ]
+            + [case((exact[f], 1.0), else_=0.0) for f in KEY_COLUMNS],
+        )
+
+        best = (
+            select(
+                ElectionResult.id.label("result_id"),
+                all_ok.label("all_ok"),
+                first_two_ok.label("first_two_ok"),
+            )
+            .where(matched[first_field])
+            .correlate(claims)
+            .order_by(
+                case((all_ok, 0), (first_two_ok, 1), else_=2),
+                score.desc(),
+                ElectionResult.id,
+            )
+            .limit(1)
+            .lateral(f"best_{first_field}")
+        )
+        return (
+            select(claims.c.idx, best.c.result_id, best.c.all_ok, best.c.first_two_ok)
+            .select_from(claims)
+            .join(best, true())
+        )
 
-    def _compare_fields(self, extracted: dict, official: ElectionResult) -> list:
+    def _compare_fields(
+        self, extracted: dict, official: Any, contest: Optional[Contest] = None
+    ) -> list:
         conflicts = []
 
         # Vote count comparison
@@ -136,10 +529,14 @@ class DeterministicMatcher:
                     }
                 )
 
-        # Percentage comparison
-        if extracted.get("percentage") is not None and official.percentage:
+        # Percentage comparison (the contest's computed share when the row
+        # has no official percentage)
+        actual_percentage = official.percentage
+        if not actual_percentage and contest is not None:
+            actual_percentage = contest.share(official.id)
+        if extracted.get("percentage") is not None and actual_percentage:
             claimed = extracted["percentage"]
-            actual = official.percentage
+            actual = actual_percentage
             if abs(claimed - actual) > 0.5:
                 conflicts.append(
                     {
@@ -149,9 +546,14 @@ class DeterministicMatcher:
                     }
                 )
 
-        # Result claim: "won" vs is_winner
+        # Result claim: "won" vs is_winner. In "X defeated Y" the subject
+        # won; that is checked against the contest instead.
+        lost_words = ("lost", "loses", "losing")
+        if len(extracted.get("candidate_names") or []) < 2:
+            lost_words += ("defeated",)
+        won = contest.is_winner(official.id) if contest is not None else official.is_winner
         if extracted.get("result_claim") in ("won", "wins", "winning", "elected"):
-            if not official.is_winner:
+            if not won:
                 conflicts.append(
                     {
                         "field": "result_claim",
@@ -159,8 +561,8 @@ class DeterministicMatcher:
                         "official": "did not win according to official results",
                     }
                 )
-        elif extracted.get("result_claim") in ("lost", "loses", "losing", "defeated"):
-            if official.is_winner:
+        elif extracted.get("result_claim") in lost_words:
+            if won:
                 conflicts.append(
                     {
                         "field": "result_claim",
@@ -171,26 +573,121 @@ class DeterministicMatcher:
 
         return conflicts
 
+    def _needs_contest(self, extracted: dict) -> bool:
+        return (
+            self._is_comparative(extracted)
+            or extracted.get("result_claim") in WIN_LOSS_WORDS
+            or extracted.get("percentage") is not None
+        )
+
+    def _is_comparative(self, extracted: dict) -> bool:
+        return (
+            len(extracted.get("candidate_names") or []) > 1
+            or extracted.get("margin") is not None
+            or extracted.get("claimed_rank") is not None
+        )
+
+    def _compare_contest(self, extracted: dict, official: Any, contest: Contest) -> list:
+        """Rank, margin and head-to-head checks against the whole race."""
+        conflicts = []
+        rank = contest.rank(official.id)
+
+        # The other candidate named, if they stood in the same race
+        opponent = None
+        for name in extracted.get("candidate_names") or []:
+            row = contest.find_candidate(name)
+            if row is not None and row.id != official.id:
+                opponent = row
+                break
+
+        if extracted.get("claimed_rank") is not None and rank is not None:
+            if extracted["claimed_rank"] != rank:
+                conflicts.append(
+                    {
+                        "field": "rank",
+                        "claimed": extracted["claimed_rank"],
+                        "official": rank,
+                    }
+                )
+
+        if opponent is not None and rank is not None:
+            claim = extracted.get("result_claim")
+            opponent_rank = contest.rank(opponent.id)
+            if (claim in AHEAD_WORDS and rank > opponent_rank) or (
+                claim in BEHIND_WORDS and rank < opponent_rank
+            ):
+                conflicts.append(
+                    {
+                        "field": "comparison",
+                        "claimed": f"{official.candidate_name} "
+                        f"{'ahead of' if claim in AHEAD_WORDS else 'behind'} "
+                        f"{opponent.candidate_name}",
+                        "official": f"{official.candidate_name} received "
+                        f"{official.vote_count:,} votes, {opponent.candidate_name} "
+                        f"{opponent.vote_count:,}",
+                    }
+                )
+
+        if extracted.get("margin") is not None:
+            if opponent is not None:
+                actual = abs(official.vote_count - opponent.vote_count)
+            else:
+                margin = contest.margin(official.id)
+                actual = abs(margin) if margin is not None else None
+            claimed = extracted["margin"]
+            # Same 1% rounding tolerance as vote counts
+            if actual is not None and abs(claimed - actual) > 0.01 * max(claimed, actual):
+                conflicts.append(
+                    {
+                        "field": "margin",
+                        "claimed": claimed,
+                        "official": actual,
+                    }
+                )
+
+        return conflicts
+
+    @staticmethod
+    def _name_agreement(claimed: str, official_name: Optional[str]) -> float:
+        """
+        1.0 when the claimed surname (or any claimed name token) equals an
+        official name token or shares its phonetic key; 0.5 otherwise — the
+        row was still picked by trigram or edit-distance similarity on the
+        name, which every relaxation level requires.
+        """
+        official_tokens = set(tokens(official_name))
+        if not official_tokens:
+            return 0.0
+        claimed_tokens = tokens(claimed)
+        if surname_key(claimed) in official_tokens or official_tokens & set(claimed_tokens):
+            return 1.0
+        official_keys = {phonetic_key(t) for t in official_tokens}
+        if any(phonetic_key(t) in official_keys for t in claimed_tokens):
+            return 1.0
+        return 0.5
+
     def _calculate_confidence(
-        self, extracted: dict, official: ElectionResult, conflicts: list
+        self, extracted: dict, official: Any, conflicts: list
     ) -> float:
         """
         Confidence reflects how many fields we could meaningfully compare.
         Higher confidence = more data points matched.
         """
-        matched_fields = 0
+        matched_fields = 0.0
         total_fields = 0
 
-        # Candidate name match
+        # Candidate name match, on the same keys the matcher used
         if extracted.get("candidate_name"):
             total_fields += 1
-            if official.candidate_name and extracted["candidate_name"].split()[-1].lower() in official.candidate_name.lower():
-                matched_fields += 1
+            matched_fields += self._name_agreement(extracted["candidate_name"], official.candidate_name)
 
         # District match
         if extracted.get("district"):
             total_fields += 1
-            if official.district and extracted["district"].lower() in official.district.lower():
+            if official.district and (
+                canonical_district(extracted["district"]) == canonical_district(official.district)
+                or extracted["district"].lower() in official.district.lower()
+            ):
                 matched_fields += 1
 
         # Party match
@@ -210,6 +707,11 @@ class DeterministicMatcher:
             if not any(c["field"] == "percentage" for c in conflicts):
                 matched_fields += 1
 
+        if extracted.get("margin") is not None:
+            total_fields += 1
+            if not any(c["field"] == "margin" for c in conflicts):
+                matched_fields += 1
+
         if total_fields == 0:
             return 0.3
 
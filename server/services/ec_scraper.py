@@ -22,6 +22,9 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.models.database import ElectionResult, OfficialSource
+from server.services.normalization import result_keys
+from server.services.contests import ContestKey, contest_cache, refresh_contest_summaries
+from server.services.source_cache import source_cache
 
 
 # Known EC results page patterns
@@ -234,6 +237,7 @@ class ECDataScraper:
             await db.flush()
 
         stored = 0
+        touched: set[ContestKey] = set()
         for r in results:
             # Check for duplicate
             existing = await db.execute(
@@ -260,12 +264,20 @@ class ECDataScraper:
                 percentage=r.get("percentage"),
                 total_valid_votes=r.get("total_valid_votes"),
                 is_winner=r.get("is_winner", 0),
+                **result_keys(r["candidate_name"], r.get("district", "National"), r["position"]),
             )
             db.add(record)
+            touched.add(ContestKey.of(record))
             stored += 1
 
         if stored > 0:
+            # Summaries of every contest this load added candidates to
+            await db.flush()
+            await refresh_contest_summaries(db, touched)
             await db.commit()
+        # The source row changed either way (hash, last_scraped)
+        source_cache.invalidate()
+        contest_cache.invalidate()
 
         return stored
 
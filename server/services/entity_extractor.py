@@ -1,5 +1,15 @@
 import re
-from typing import Any
+from functools import lru_cache
+from typing import Any, Iterable
+
+from server.services.gazetteer import (
+    CANDIDATE,
+    DISTRICT,
+    PARTY,
+    POSITION,
+    Gazetteer,
+    build_entries,
+)
 
 
 # Known Uganda election entities for supplementary matching
@@ -110,6 +120,24 @@ FALLBACK_NAME_PATTERNS = [
     r"([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)+)\s*\([A-Z]+\)",
 ]
 
+# "beat Y by 20,000 votes", "won by a margin of 1,200" — never part of a
+# longer or decimal number, or a percentage ("won by 58.6%")
+_MARGIN_NUMBER = r"(\d{1,3}(?:,\d{3})+|\d+)(?![.,]?\d)(?!\s*(?:%|percent))"
+MARGIN_PATTERN = (
+    rf"\bby\s+(?:a\s+)?(?:margin\s+of\s+)?{_MARGIN_NUMBER}\s*(?:votes?)?"
+    rf"|\bmargin\s+of\s+{_MARGIN_NUMBER}"
+)
+
+# "came second", "finished 3rd"
+RANK_PATTERN = (
+    r"\b(?:came|finished|placed|emerged|was|is|ranked)\s+"
+    r"(first|second|third|fourth|fifth|1st|2nd|3rd|4th|5th)\b"
+)
+RANK_WORDS = {
+    "first": 1, "1st": 1, "second": 2, "2nd": 2, "third": 3, "3rd": 3,
+    "fourth": 4, "4th": 4, "fifth": 5, "5th": 5,
+}
+
 FALLBACK_VOTE_PATTERNS = [
     # "received/got/polled/garnered 340 votes" or just "received 340"
     r"(?:received|got|polled|garnered)\s+(\d+)\s*(?:votes?)?",
@@ -128,19 +156,67 @@ ELECTION_CONTEXT_PATTERNS = [
 ]
 
 
+SPACY_MODEL = "en_core_web_sm"
+
+
+def load_spacy_model() -> Any:
+    """Load the spaCy pipeline, falling back to a blank English model."""
+    import spacy
+
+    try:
+        return spacy.load(SPACY_MODEL)
+    except OSError:
+        print(f"WARNING: {SPACY_MODEL} not found, using blank model. Run: python -m spacy download {SPACY_MODEL}")
+        return spacy.blank("en")
+
+
+# Bump when the entity lists above change so the automaton is rebuilt
+GAZETTEER_VERSION = "2026.1"
+
+
+@lru_cache(maxsize=4)
+def get_gazetteer(version: str = GAZETTEER_VERSION) -> Gazetteer:
+    """Compiled automaton over the known entity lists, built once per version."""
+    return Gazetteer(
+        build_entries(KNOWN_CANDIDATES, KNOWN_DISTRICTS, KNOWN_POSITIONS, KNOWN_PARTIES)
+    )
+
+
 class EntityExtractor:
     """Extract election-related entities from claim text."""
 
     def __init__(self, nlp: Any):
         self.nlp = nlp
-        # Sort longest-first so "Kampala Central" matches before "Kampala"
-        sorted_districts = sorted(KNOWN_DISTRICTS, key=len, reverse=True)
-        self._district_lower = {d.lower(): d for d in sorted_districts}
+        self._gazetteer = get_gazetteer()
+        self._district_lower = {d.lower(): d for d in KNOWN_DISTRICTS}
 
     def extract(self, text: str) -> dict:
-        doc = self.nlp(text)
+        return self._extract_fields(text, self.nlp(text))
+
+    def extract_many(
+        self,
+        texts: Iterable[str],
+        batch_size: int = 64,
+        n_process: int = 1,
+    ) -> list[dict]:
+        """
+        Extract fields for many claims, streaming them through spaCy's
+        nlp.pipe in batches. Returns one field dict per text, in order.
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        return [self._extract_fields(text, doc) for text, doc in zip(texts, docs)]
+
+    def _extract_fields(self, text: str, doc: Any) -> dict:
         text_lower = text.lower()
 
+        # One pass over the text finds every known candidate, district,
+        # position and party mention (longest match per category)
+        mentions = self._gazetteer.find_all(text)
+        known = self._gazetteer.best(mentions)
+
         fields: dict = {
             "candidate_name": None,
             "party": None,
@@ -149,14 +225,22 @@ class EntityExtractor:
             "vote_count": None,
             "percentage": None,
             "result_claim": None,
+            # Comparative claims: every candidate named, in order of mention
+            "candidate_names": [],
+            "margin": None,
+            "claimed_rank": None,
         }
 
         # ── Candidate name ───────────────────────────────────────────
         # 1. Known candidate aliases (highest priority)
-        for alias, full_name in KNOWN_CANDIDATES.items():
-            if alias in text_lower:
-                fields["candidate_name"] = full_name
-                break
+        for m in sorted(mentions, key=lambda m: m.start):
+            if m.category == CANDIDATE and m.canonical not in fields["candidate_names"]:
+                fields["candidate_names"].append(m.canonical)
+        if len(fields["candidate_names"]) > 1:
+            # "X beat Y": the subject is the first candidate mentioned
+            fields["candidate_name"] = fields["candidate_names"][0]
+        elif known[CANDIDATE]:
+            fields["candidate_name"] = known[CANDIDATE].canonical
 
         # 2. spaCy PERSON entities
         if not fields["candidate_name"]:
@@ -172,6 +256,24 @@ class EntityExtractor:
                     fields["candidate_name"] = match.group(1).strip()
                     break
 
+        # ── Margin and rank ──────────────────────────────────────────
+        margin_match = re.search(MARGIN_PATTERN, text_lower)
+        if margin_match:
+            raw = margin_match.group(1) or margin_match.group(2)
+            fields["margin"] = int(raw.replace(",", ""))
+            if re.search(r"\bvotes?\b|\bmargin\b", margin_match.group(0)):
+                # Unambiguous margin ("by N votes", "margin of N"): keep it
+                # from being read as the vote count below
+                text_lower = (
+                    text_lower[: margin_match.start()]
+                    + " " * (margin_match.end() - margin_match.start())
+                    + text_lower[margin_match.end():]
+                )
+
+        rank_match = re.search(RANK_PATTERN, text_lower)
+        if rank_match:
+            fields["claimed_rank"] = RANK_WORDS[rank_match.group(1)]
+
         # ── Vote count ───────────────────────────────────────────────
         # Try structured patterns first, then fallback
         vote_patterns = [
@@ -213,17 +315,12 @@ class EntityExtractor:
             fields["percentage"] = float(pct_match.group(1))
 
         # ── Party ────────────────────────────────────────────────────
-        text_upper = text.upper()
-        for abbr in KNOWN_PARTIES:
-            if re.search(rf"\b{abbr}\b", text_upper):
-                fields["party"] = abbr
-                break
+        if known[PARTY]:
+            fields["party"] = known[PARTY].canonical
 
         # ── District / location ──────────────────────────────────────
-        for d_lower, d_proper in self._district_lower.items():
-            if d_lower in text_lower:
-                fields["district"] = d_proper
-                break
+        if known[DISTRICT]:
+            fields["district"] = known[DISTRICT].canonical
 
         # Fall back to spaCy GPE entities
         if not fields["district"]:
@@ -262,11 +359,8 @@ class EntityExtractor:
                 break
 
         # ── Position ─────────────────────────────────────────────────
-        if not fields["position"]:
-            for pos in KNOWN_POSITIONS:
-                if pos.lower() in text_lower:
-                    fields["position"] = pos
-                    break
+        if not fields["position"] and known[POSITION]:
+            fields["position"] = known[POSITION].canonical
 
         # Default to presidential if known presidential candidate
         if not fields["position"] and fields["candidate_name"]:
@@ -285,10 +379,35 @@ class EntityExtractor:
         if fields["position"] == "President" and not fields["district"]:
             fields["district"] = "National"
 
-        # ── Result claim keyword ─────────────────────────────────────
+        # ── Result claim keyword (first one in the text) ─────────────
+        first_at = None
         for keyword in RESULT_KEYWORDS:
-            if re.search(rf"\b{keyword}\b", text_lower):
+            match = re.search(rf"\b{keyword}\b", text_lower)
+            if match and (first_at is None or match.start() < first_at):
                 fields["result_claim"] = keyword
-                break
+                first_at = match.start()
 
         return fields
+
+
+# ── Worker-process entry points ─────────────────────────────────────
+# Used when extraction runs on a process WorkerPool: each worker loads
+# its own spaCy model once, then serves many claims.
+_worker_extractor: EntityExtractor | None = None
+
+
+def init_extraction_worker() -> None:
+    global _worker_extractor
+    _worker_extractor = EntityExtractor(load_spacy_model())
+
+
+def extract_in_worker(text: str) -> dict:
+    if _worker_extractor is None:
+        init_extraction_worker()
+    return _worker_extractor.extract(text)
+
+
+def extract_many_in_worker(texts: list[str]) -> list[dict]:
+    if _worker_extractor is None:
+        init_extraction_worker()
+    return _worker_extractor.extract_many(texts)
@@ -2,6 +2,9 @@ from typing import Any, Optional
 
 from server.models.enums import AlignmentStatus
 
+# Ranked alternatives named when a fuzzy name match is explained
+CLOSEST_NAMES = 3
+
 
 class ExplanationGenerator:
     """Generate human-readable explanations from match results."""
@@ -12,11 +15,14 @@ class ExplanationGenerator:
         extracted: dict,
         official_result: Optional[Any],
         conflicts: list,
+        candidates: Optional[list] = None,
     ) -> str:
         if alignment == AlignmentStatus.MATCHES:
-            return self._matches(extracted, official_result)
+            return self._with_candidates(self._matches(extracted, official_result), candidates)
         elif alignment == AlignmentStatus.CONFLICTS:
-            return self._conflicts(extracted, official_result, conflicts)
+            return self._with_candidates(
+                self._conflicts(extracted, official_result, conflicts), candidates
+            )
         elif alignment == AlignmentStatus.NO_OFFICIAL_DATA:
             return self._no_data(extracted)
         elif alignment == AlignmentStatus.CANNOT_VERIFY:
@@ -66,6 +72,21 @@ class ExplanationGenerator:
                     f"The claimed percentage of {conflict['claimed']}% does not match "
                     f"the official figure of {conflict['official']}%."
                 )
+            elif conflict["field"] == "margin":
+                parts.append(
+                    f"The claimed margin of {conflict['claimed']:,} votes does not match "
+                    f"the official margin of {conflict['official']:,}."
+                )
+            elif conflict["field"] == "rank":
+                parts.append(
+                    f"The claim places the candidate at position {conflict['claimed']}, "
+                    f"but official results rank them {conflict['official']}."
+                )
+            elif conflict["field"] == "comparison":
+                parts.append(
+                    f"The claim states {conflict['claimed']}, but official records "
+                    f"show: {conflict['official']}."
+                )
             elif conflict["field"] == "result_claim":
                 parts.append(
                     f"The claim states the candidate \"{conflict['claimed']}\" but "
@@ -74,6 +95,19 @@ class ExplanationGenerator:
 
         return " ".join(parts)
 
+    def _with_candidates(self, explanation: str, candidates: Optional[list]) -> str:
+        """Name the ranked alternatives (RankedCandidate) when the fuzzy ranker chose the match."""
+        if not candidates:
+            return explanation
+        closest = ", ".join(
+            f"{c.result.candidate_name} ({c.result.district}, score {c.score:.2f})"
+            for c in candidates[:CLOSEST_NAMES]
+        )
+        return (
+            f"{explanation} The name matched no official record exactly; "
+            f"the closest official names were {closest}."
+        )
+
     def _no_data(self, extracted: dict) -> str:
         candidate = extracted.get("candidate_name") or "the mentioned candidate"
         district = extracted.get("district") or "the specified area"
@@ -85,7 +119,7 @@ class ExplanationGenerator:
         )
 
     def _cannot_verify(self, extracted: dict) -> str:
-        detected = [k for k, v in extracted.items() if v is not None]
+        detected = [k for k, v in extracted.items() if v not in (None, [])]
         if not detected:
             return (
                 "We could not extract any verifiable election claim from the "
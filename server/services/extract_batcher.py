@@ -0,0 +1,26 @@
+from typing import Any
+
+from server.services.batcher import Batcher
+from server.services.entity_extractor import EntityExtractor, extract_many_in_worker
+from server.services.worker_pool import WorkerPool
+
+
+class ExtractBatcher(Batcher):
+    """
+    Coalesce entity extraction from concurrent requests: each batch goes
+    through spaCy's nlp.pipe (EntityExtractor.extract_many) as one job on
+    the NLP pool, so the pool's capacity and timeout apply per batch.
+    """
+
+    def __init__(self, nlp: Any, nlp_pool: WorkerPool, window_ms: float, max_batch: int = 64):
+        super().__init__(window_ms, max_batch)
+        self.nlp = nlp
+        self.nlp_pool = nlp_pool
+
+    async def extract(self, text: str) -> dict:
+        return await self.submit(text)
+
+    async def _run_batch(self, items: list[str]) -> list[dict]:
+        if self.nlp_pool.kind == "process":
+            return await self.nlp_pool.run(extract_many_in_worker, items)
+        return await self.nlp_pool.run(EntityExtractor(self.nlp).extract_many, items)
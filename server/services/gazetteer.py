@@ -0,0 +1,167 @@
+"""
+Single-pass gazetteer matching for known election entities.
+
+All candidate aliases, districts and positions are compiled into one
+case-insensitive Aho-Corasick automaton, and party abbreviations into a
+second, case-sensitive one, so a claim is scanned twice no matter how
+many names are loaded. Build it once and share it; see
+entity_extractor.get_gazetteer.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+CANDIDATE = "candidate"
+DISTRICT = "district"
+POSITION = "position"
+PARTY = "party"
+
+
+@dataclass(frozen=True)
+class GazetteerMatch:
+    category: str
+    canonical: str
+    start: int
+    end: int
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start
+
+
+class _Automaton:
+    """Aho-Corasick automaton over (pattern, category, canonical) entries."""
+
+    def __init__(self):
+        # Trie transitions, failure links and per-node outputs.
+        # Outputs are (pattern length, category, canonical).
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[tuple[int, str, str]]] = [[]]
+
+    def add(self, pattern: str, category: str, canonical: str) -> None:
+        if not pattern:
+            return
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[node][ch] = nxt
+            node = nxt
+        entry = (len(pattern), category, canonical)
+        if entry not in self._out[node]:
+            self._out[node].append(entry)
+
+    def build(self) -> None:
+        # Breadth-first pass to set failure links and merge outputs
+        queue = list(self._goto[0].values())
+        for child in queue:
+            self._fail[child] = 0
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find_all(self, text: str) -> list[GazetteerMatch]:
+        """Every whole-word mention in text, in order of where it ends."""
+        goto, fail, out = self._goto, self._fail, self._out
+        matches = []
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if not out[node]:
+                continue
+            end = i + 1
+            for length, category, canonical in out[node]:
+                start = end - length
+                # Whole-word only: "MP" must not fire inside "Kampala"
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if end < len(text) and text[end].isalnum():
+                    continue
+                matches.append(GazetteerMatch(category, canonical, start, end))
+        return matches
+
+
+class Gazetteer:
+    """
+    Aho-Corasick matching of (category, surface form, canonical) entries.
+
+    Matching ignores case except for the case_sensitive categories, which
+    get their own automaton over the original text: party abbreviations
+    only count in capitals, so "ant", "dp" or "cp" in a sentence are not
+    parties.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[tuple[str, str, str]],
+        case_sensitive: Iterable[str] = (PARTY,),
+    ):
+        case_sensitive = set(case_sensitive)
+        self._folded = _Automaton()
+        self._exact = _Automaton()
+        for category, surface, canonical in entries:
+            if category in case_sensitive:
+                self._exact.add(surface, category, canonical)
+            else:
+                self._folded.add(surface.lower(), category, canonical)
+        self._folded.build()
+        self._exact.build()
+
+    def find_all(self, text: str) -> list[GazetteerMatch]:
+        """Return every whole-word gazetteer mention in text, in one pass per automaton."""
+        matches = self._folded.find_all(text.lower()) + self._exact.find_all(text)
+        return sorted(matches, key=lambda m: m.end)
+
+    def find(self, text: str) -> dict[str, Optional[GazetteerMatch]]:
+        """
+        Best mention per category: longest wins ("Kampala Central" beats
+        "Kampala"), ties go to the earliest mention in the text.
+        """
+        return self.best(self.find_all(text))
+
+    @staticmethod
+    def best(matches: list[GazetteerMatch]) -> dict[str, Optional[GazetteerMatch]]:
+        """find() over matches already returned by find_all()."""
+        best: dict[str, Optional[GazetteerMatch]] = {
+            CANDIDATE: None,
+            DISTRICT: None,
+            POSITION: None,
+            PARTY: None,
+        }
+        for m in matches:
+            current = best.get(m.category)
+            if (
+                current is None
+                or m.length > current.length
+                or (m.length == current.length and m.start < current.start)
+            ):
+                best[m.category] = m
+        return best
+
+
+def build_entries(
+    candidates: dict[str, str],
+    districts: Iterable[str],
+    positions: Iterable[str],
+    parties: Iterable[str],
+) -> list[tuple[str, str, str]]:
+    entries = [(CANDIDATE, alias, full) for alias, full in candidates.items()]
+    entries += [(DISTRICT, d, d) for d in districts]
+    entries += [(POSITION, p, p) for p in positions]
+    entries += [(PARTY, abbr, abbr) for abbr in parties]
+    return entries
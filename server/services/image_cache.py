@@ -0,0 +1,171 @@
+"""
+Content-addressed cache for image verifications.
+
+Viral screenshots arrive many times, either byte-identical or re-compressed
+by each messaging app along the way. Entries are keyed by the SHA-256 of
+the upload, which skips OCR entirely, and indexed by a 64-bit perceptual
+dHash. A near-identical copy within the Hamming threshold is only served
+once its own OCR text has confirmed it: screenshots of one template with
+different names or numbers hash alike, so the dHash alone cannot tell
+claims apart. Every entry is tied to the official-data version it was
+verified against and is ignored once the data changes.
+
+Only the extracted text and the verification result are kept. Image bytes
+are never stored, in line with the privacy rule in verify.py.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+HASH_BITS = 64
+
+
+def _text_key(text: Optional[str]) -> str:
+    return " ".join((text or "").split())
+
+
+class _Entry:
+    __slots__ = ("dhash", "value", "expires_at", "data_version", "text_key")
+
+    def __init__(
+        self,
+        dhash: Optional[int],
+        value: Any,
+        expires_at: float,
+        data_version: str,
+        text_key: str,
+    ):
+        self.dhash = dhash
+        self.value = value
+        self.expires_at = expires_at
+        self.data_version = data_version
+        self.text_key = text_key
+
+
+class ImageResultCache:
+    """In-process LRU + TTL cache keyed by exact and perceptual image hashes."""
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        ttl_seconds: float = 900,
+        hamming_threshold: int = 2,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hamming_threshold = hamming_threshold
+
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+
+        # Multi-index hashing: split the 64-bit dHash into threshold + 1
+        # bands. Two hashes within the threshold must agree exactly on at
+        # least one band, so only entries sharing a band are compared.
+        n_bands = min(hamming_threshold + 1, HASH_BITS)
+        width = HASH_BITS // n_bands
+        self._bands = [
+            (i * width, HASH_BITS - i * width if i == n_bands - 1 else width)
+            for i in range(n_bands)
+        ]
+        self._band_index: dict[tuple[int, int], set[str]] = {}
+
+        self.hits = 0
+        self.near_hits = 0
+        self.misses = 0
+
+    def _band_keys(self, dhash: int) -> list[tuple[int, int]]:
+        return [
+            (i, (dhash >> shift) & ((1 << width) - 1))
+            for i, (shift, width) in enumerate(self._bands)
+        ]
+
+    def get_exact(self, sha256: str, data_version: str) -> Optional[Any]:
+        entry = self._entries.get(sha256)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic() or entry.data_version != data_version:
+            self._remove(sha256)
+            return None
+        self._entries.move_to_end(sha256)
+        self.hits += 1
+        return entry.value
+
+    def contains(self, sha256: str, data_version: str) -> bool:
+        """Whether a live entry exists, without counting a hit."""
+        entry = self._entries.get(sha256)
+        return (
+            entry is not None
+            and entry.expires_at > time.monotonic()
+            and entry.data_version == data_version
+        )
+
+    def get_similar(self, dhash: int, data_version: str, extracted_text: str) -> Optional[Any]:
+        """
+        Closest cached entry within the Hamming threshold whose OCR text
+        matches extracted_text (whitespace-insensitive), if any.
+        """
+        text_key = _text_key(extracted_text)
+        best_key, best_distance = None, self.hamming_threshold + 1
+        candidates = set()
+        for band_key in self._band_keys(dhash):
+            candidates |= self._band_index.get(band_key, set())
+
+        now = time.monotonic()
+        for key in candidates:
+            entry = self._entries.get(key)
+            if (
+                entry is None
+                or entry.expires_at <= now
+                or entry.data_version != data_version
+                or entry.text_key != text_key
+            ):
+                continue
+            distance = (entry.dhash ^ dhash).bit_count()
+            if distance < best_distance:
+                best_key, best_distance = key, distance
+
+        if best_key is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(best_key)
+        self.near_hits += 1
+        return self._entries[best_key].value
+
+    def put(self, sha256: str, dhash: Optional[int], value: Any, data_version: str) -> None:
+        """Cache a result (with its extracted_text) verified against data_version."""
+        if sha256 in self._entries:
+            self._remove(sha256)
+
+        self._entries[sha256] = _Entry(
+            dhash,
+            value,
+            time.monotonic() + self.ttl_seconds,
+            data_version,
+            _text_key(value.get("extracted_text")),
+        )
+        if dhash is not None:
+            for band_key in self._band_keys(dhash):
+                self._band_index.setdefault(band_key, set()).add(sha256)
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def _remove(self, sha256: str) -> None:
+        entry = self._entries.pop(sha256, None)
+        if entry is None or entry.dhash is None:
+            return
+        for band_key in self._band_keys(entry.dhash):
+            keys = self._band_index.get(band_key)
+            if keys is not None:
+                keys.discard(sha256)
+                if not keys:
+                    del self._band_index[band_key]
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "near_hits": self.near_hits,
+            "misses": self.misses,
+        }
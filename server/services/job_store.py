@@ -0,0 +1,93 @@
+import json
+import time
+from typing import AsyncIterator, Optional
+
+# queued -> processing -> done | failed
+TERMINAL_STATUSES = ("done", "failed")
+
+
+class JobStore:
+    """
+    State of async image verification jobs, shared by the API and the
+    Celery workers through Redis.
+
+    Each job is one JSON value (status, and the result or error once
+    finished) that expires after ttl_seconds like the other caches — it
+    holds OCR text, never image bytes. Every write is also published on the
+    job's channel so SSE clients hear about it without polling.
+    """
+
+    def __init__(self, redis_url: str, ttl_seconds: int = 900):
+        self._redis_url = redis_url
+        self.ttl_seconds = ttl_seconds
+        self._redis = None
+
+    async def _get_redis(self):
+        if self._redis is None:
+            import redis.asyncio as aioredis
+
+            self._redis = aioredis.from_url(self._redis_url, socket_connect_timeout=1)
+        return self._redis
+
+    def _key(self, job_id: str) -> str:
+        return f"yesveri:job:{job_id}"
+
+    def _channel(self, job_id: str) -> str:
+        return f"yesveri:job:{job_id}:events"
+
+    async def _write(self, job: dict) -> dict:
+        r = await self._get_redis()
+        data = json.dumps(job, default=str)
+        await r.setex(self._key(job["job_id"]), self.ttl_seconds, data)
+        await r.publish(self._channel(job["job_id"]), data)
+        return job
+
+    async def create(self, job_id: str, status: str = "queued", **fields) -> dict:
+        now = time.time()
+        return await self._write(
+            {"job_id": job_id, "status": status, "created_at": now, "updated_at": now, **fields}
+        )
+
+    async def update(self, job_id: str, status: str, **fields) -> dict:
+        """Set a job's status (and result or error). One worker owns a job, so no locking."""
+        job = await self.get(job_id) or {"job_id": job_id, "created_at": time.time()}
+        job.update(fields, status=status, updated_at=time.time())
+        return await self._write(job)
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        r = await self._get_redis()
+        data = await r.get(self._key(job_id))
+        return json.loads(data) if data else None
+
+    async def watch(
+        self, job_id: str, timeout: float, heartbeat: float = 15.0
+    ) -> AsyncIterator[Optional[dict]]:
+        """
+        Yield the job now and after every change until it finishes or
+        timeout seconds pass; yields None after heartbeat seconds of quiet.
+        """
+        r = await self._get_redis()
+        pubsub = r.pubsub()
+        # Subscribe before reading so no update can slip in between
+        await pubsub.subscribe(self._channel(job_id))
+        try:
+            job = await self.get(job_id)
+            if job is None:
+                return
+            yield job
+            deadline = time.monotonic() + timeout
+            while job["status"] not in TERMINAL_STATUSES and time.monotonic() < deadline:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=heartbeat)
+                if message is None:
+                    yield None
+                    continue
+                job = json.loads(message["data"])
+                yield job
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
@@ -0,0 +1,30 @@
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.services.batcher import Batcher
+from server.services.deterministic_matcher import DeterministicMatcher, MatchResult
+
+
+class MatchBatcher(Batcher):
+    """
+    Coalesce matcher lookups from concurrent requests: each batch is
+    resolved with one DeterministicMatcher.match_many query on a session
+    of the batcher's own.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        window_ms: float,
+        max_batch: int = 64,
+    ):
+        super().__init__(window_ms, max_batch)
+        self._session_factory = session_factory
+
+    async def match(self, extracted: dict) -> MatchResult:
+        return await self.submit(extracted)
+
+    async def _run_batch(self, items: list[dict]) -> list[MatchResult]:
+        async with self._session_factory() as db:
+            return await DeterministicMatcher().match_many(items, db)
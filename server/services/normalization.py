@@ -0,0 +1,96 @@
+"""
+Normalization shared by ingest and matching.
+
+Names, districts and positions are compared as lowercase ASCII tokens with
+punctuation and diacritics removed, so "Ssentamu", "SSENTAMU" and
+"Ssentamú" all compare equal. Name tokens also get a phonetic key that
+folds the spelling variants common in Luganda and Runyankole names, so
+"Sentamu" and "Ssentamu" share a key.
+"""
+
+import re
+import unicodedata
+from typing import Optional
+
+_APOSTROPHES = re.compile(r"['’`]")
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+# Phonetic folding, applied in order to a normalized token
+_PHONETIC_RULES = [
+    (re.compile(r"ph"), "f"),
+    (re.compile(r"ch|c|q"), "k"),
+    (re.compile(r"x"), "ks"),
+    (re.compile(r"v"), "f"),
+    # r and l are one phoneme in Luganda: "Rubaga" / "Lubaga"
+    (re.compile(r"r"), "l"),
+    # "ny" is spelled n/ny/nny: "Ssenyonyi" / "Sennyonyi"
+    (re.compile(r"ny"), "n"),
+    # Prenasalised consonants are often written without the nasal:
+    # "Kyangulanyi" / "Kyagulanyi", "Ssentamu" / "Setamu"
+    (re.compile(r"[mn](?=[bdfgjkpstz])"), ""),
+    # Doubled consonants and vowels: "Ss" / "S", "Luuka" / "Luka"
+    (re.compile(r"(.)\1+"), r"\1"),
+]
+
+# Spelled-out forms for position abbreviations used in claims
+POSITION_ALIASES = {
+    "mp": "member of parliament",
+    "woman mp": "woman member of parliament",
+}
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """Lowercase, strip diacritics and punctuation, collapse whitespace."""
+    if not value:
+        return ""
+    folded = unicodedata.normalize("NFKD", value)
+    folded = "".join(ch for ch in folded if not unicodedata.combining(ch))
+    folded = _APOSTROPHES.sub("", folded.lower())
+    return _NON_ALNUM.sub(" ", folded).strip()
+
+
+def tokens(value: Optional[str]) -> list[str]:
+    return normalize_text(value).split()
+
+
+def surname_key(name: Optional[str]) -> str:
+    """Last name token — the key claims are matched on."""
+    parts = tokens(name)
+    return parts[-1] if parts else ""
+
+
+def canonical_position(position: Optional[str]) -> str:
+    normalized = normalize_text(position)
+    return POSITION_ALIASES.get(normalized, normalized)
+
+
+def canonical_district(district: Optional[str]) -> str:
+    """Normalized district with a trailing "district" dropped ("Kampala District")."""
+    parts = tokens(district)
+    if len(parts) > 1 and parts[-1] == "district":
+        parts = parts[:-1]
+    return " ".join(parts)
+
+
+def phonetic_key(token: str) -> str:
+    """Spelling-variant-tolerant key for one name token."""
+    key = normalize_text(token).replace(" ", "")
+    for pattern, replacement in _PHONETIC_RULES:
+        key = pattern.sub(replacement, key)
+    return key
+
+
+def phonetic_keys(name: Optional[str]) -> list[str]:
+    """Distinct phonetic keys of every token in a name, in order."""
+    return list(dict.fromkeys(phonetic_key(t) for t in tokens(name)))
+
+
+def result_keys(candidate_name: Optional[str], district: Optional[str], position: Optional[str]) -> dict:
+    """Normalized ElectionResult key columns, computed once at ingest."""
+    return {
+        "name_key": normalize_text(candidate_name),
+        "surname_key": surname_key(candidate_name),
+        "district_key": canonical_district(district),
+        "position_key": canonical_position(position),
+        "name_phonetics": phonetic_keys(candidate_name),
+    }
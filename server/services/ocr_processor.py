@@ -2,11 +2,42 @@ import io
 
 from PIL import Image
 
+OCR_BACKENDS = ("pytesseract", "tesserocr")
+
 
 class OCRProcessor:
-    """Extract text from images using Tesseract OCR."""
+    """
+    Extract text from images using Tesseract OCR.
+
+    Backends:
+      - "pytesseract": runs the tesseract binary for every image
+      - "tesserocr": keeps one initialized Tesseract engine alive for the
+        lifetime of this processor, so the model is loaded once and reused
+    """
+
+    def __init__(
+        self,
+        tesseract_cmd: str = "/usr/bin/tesseract",
+        backend: str = "pytesseract",
+        tessdata_path: str = "",
+    ):
+        if backend not in OCR_BACKENDS:
+            raise ValueError(f"Unknown OCR backend: {backend!r}")
+
+        self._api = None
+        if backend == "tesserocr":
+            try:
+                import tesserocr
+
+                kwargs = {"lang": "eng"}
+                if tessdata_path:
+                    kwargs["path"] = tessdata_path
+                self._api = tesserocr.PyTessBaseAPI(**kwargs)
+            except (ImportError, RuntimeError) as e:
+                print(f"WARNING: tesserocr backend unavailable ({e}), falling back to pytesseract")
+                backend = "pytesseract"
+        self.backend = backend
 
-    def __init__(self, tesseract_cmd: str = "/usr/bin/tesseract"):
         try:
             import pytesseract
 
@@ -14,25 +45,113 @@ class OCRProcessor:
             self._pytesseract = pytesseract
             self._available = True
         except ImportError:
-            self._available = False
+            self._available = self._api is not None
 
     def extract_text(self, image_bytes: bytes) -> str:
+        return self.extract_text_and_dhash(image_bytes)[0]
+
+    def extract_text_and_dhash(self, image_bytes: bytes) -> tuple[str, int | None]:
+        """
+        OCR text plus the image's dHash, both from one decode: the hash is
+        taken from the reduced grayscale image passed to Tesseract (None if
+        it fails).
+        """
         if not self._available:
             raise RuntimeError(
                 "pytesseract is not installed. Install it with: pip install pytesseract"
             )
 
-        image = Image.open(io.BytesIO(image_bytes))
+        image = _prepare(image_bytes)
+        try:
+            dhash = dhash_image(image)
+        except Exception:
+            dhash = None
+
+        if self._api is not None:
+            # Reuse the already-initialized engine; Clear() drops the image
+            # and results but keeps the loaded model
+            try:
+                self._api.SetImage(image)
+                text = self._api.GetUTF8Text()
+            finally:
+                self._api.Clear()
+        else:
+            text = self._pytesseract.image_to_string(image, lang="eng")
+        return text.strip(), dhash
+
+    def close(self) -> None:
+        if self._api is not None:
+            self._api.End()
+            self._api = None
+
+
+def _prepare(image_bytes: bytes) -> Image.Image:
+    """Decode to a grayscale image no larger than 2000px on its long side."""
+    image = Image.open(io.BytesIO(image_bytes))
+
+    # Decode straight to (roughly) the target resolution instead of
+    # materialising the full-size image first: JPEG can scale by 1/2,
+    # 1/4 or 1/8 inside the decoder; other formats use an integer
+    # box reduce before any further copies are made
+    max_dim = 2000
+    if image.format == "JPEG":
+        image.draft("L", (max_dim, max_dim))
+    elif max(image.size) >= 2 * max_dim:
+        image = image.reduce(max(image.size) // max_dim)
+
+    # Convert to grayscale for better OCR accuracy
+    image = image.convert("L")
+
+    # Resize if very large (improves speed without hurting accuracy much)
+    if max(image.size) > max_dim:
+        ratio = max_dim / max(image.size)
+        new_size = (int(image.width * ratio), int(image.height * ratio))
+        image = image.resize(new_size, Image.Resampling.LANCZOS)
+    return image
+
+
+def dhash_image(image: Image.Image) -> int:
+    """
+    64-bit difference hash: each bit says whether a pixel is brighter than
+    its right-hand neighbour in a 9x8 grayscale thumbnail. Survives
+    re-compression and resizing, so forwarded copies hash alike.
+    """
+    pixels = image.convert("L").resize((9, 8), Image.Resampling.BILINEAR).tobytes()
+
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            value = (value << 1) | (left > right)
+    return value
+
+
+# ── Worker-process entry points ─────────────────────────────────────
+# OCR runs on a process WorkerPool; each worker keeps one OCRProcessor
+# (and, with the tesserocr backend, one live engine) for its lifetime.
+_worker_ocr: OCRProcessor | None = None
+
+
+def init_ocr_worker(
+    tesseract_cmd: str,
+    backend: str = "pytesseract",
+    tessdata_path: str = "",
+) -> None:
+    global _worker_ocr
+    _worker_ocr = OCRProcessor(tesseract_cmd, backend=backend, tessdata_path=tessdata_path)
+
+
+def _worker_processor() -> OCRProcessor:
+    if _worker_ocr is None:
+        init_ocr_worker("/usr/bin/tesseract")
+    return _worker_ocr
+
 
-        # Convert to grayscale for better OCR accuracy
-        image = image.convert("L")
+def extract_text_in_worker(image_bytes: bytes) -> str:
+    return _worker_processor().extract_text(image_bytes)
 
-        # Resize if very large (improves speed without hurting accuracy much)
-        max_dim = 2000
-        if max(image.size) > max_dim:
-            ratio = max_dim / max(image.size)
-            new_size = (int(image.width * ratio), int(image.height * ratio))
-            image = image.resize(new_size, Image.Resampling.LANCZOS)
 
-        text = self._pytesseract.image_to_string(image, lang="eng")
-        return text.strip()
+def ocr_in_worker(image_bytes: bytes) -> tuple[str, int | None]:
+    """OCR text and dHash in one trip to the worker (dHash None if it fails)."""
+    return _worker_processor().extract_text_and_dhash(image_bytes)
@@ -0,0 +1,204 @@
+"""
+Immutable in-memory snapshot of the official results.
+
+The official dataset is small and only changes when the scraper or seed
+runs, so instead of several ILIKE round trips per claim the matcher can
+work from a copy held in memory. Results carry their source pre-joined,
+hash indexes map each normalized token of candidate_name, district,
+position and party to the rows containing it, and a CandidateRanker holds
+the same rows as NumPy arrays for fuzzy ranking.
+
+SnapshotStore rebuilds the snapshot when the data version changes and
+swaps it in with a single reference assignment; requests already holding
+the old snapshot keep using it.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.models.database import ElectionResult
+from server.services.candidate_ranker import CandidateRanker
+from server.services.contests import Contest, ContestKey, contest_cache, group_contests
+from server.services.data_version import DataVersionTracker
+from server.services.normalization import (
+    canonical_district,
+    canonical_position,
+    phonetic_key,
+    phonetic_keys,
+    tokens,
+)
+from server.services.source_cache import SourceRecord, source_cache
+
+INDEXED_FIELDS = ("candidate_name", "district", "position", "party")
+
+
+@dataclass(frozen=True)
+class ResultRecord:
+    id: int
+    source_id: int
+    election_level: str
+    election_year: int
+    district: str
+    constituency: Optional[str]
+    polling_station: Optional[str]
+    position: str
+    candidate_name: str
+    party: Optional[str]
+    vote_count: int
+    percentage: Optional[float]
+    total_valid_votes: Optional[int]
+    is_winner: int
+    last_updated: Optional[datetime]
+    source: Optional[SourceRecord]
+
+
+def _field_tokens(field: str, value: Optional[str]) -> list[str]:
+    if field == "position":
+        return canonical_position(value).split()
+    if field == "district":
+        return canonical_district(value).split()
+    return tokens(value)
+
+
+class ResultsSnapshot:
+    def __init__(self, version: str, results: Iterable[ResultRecord]):
+        self.version = version
+        self.results = tuple(sorted(results, key=lambda r: r.id))
+        self._by_id = {r.id: r for r in self.results}
+
+        index: dict[str, dict[str, set[int]]] = {f: {} for f in INDEXED_FIELDS}
+        for r in self.results:
+            for field in INDEXED_FIELDS:
+                for token in _field_tokens(field, getattr(r, field)):
+                    index[field].setdefault(token, set()).add(r.id)
+        self._index = {
+            field: {token: frozenset(ids) for token, ids in postings.items()}
+            for field, postings in index.items()
+        }
+
+        # Candidate name tokens by phonetic key, for spelling variants
+        phonetic: dict[str, set[int]] = {}
+        for r in self.results:
+            for key in phonetic_keys(r.candidate_name):
+                phonetic.setdefault(key, set()).add(r.id)
+        self._phonetic = {key: frozenset(ids) for key, ids in phonetic.items()}
+
+        # Columnar arrays for vectorized fuzzy ranking
+        self.ranker = CandidateRanker(self.results)
+
+        # Every race, for comparative claims
+        self._contests = group_contests(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def get(self, result_id: int) -> Optional[ResultRecord]:
+        return self._by_id.get(result_id)
+
+    def contest(self, result: ResultRecord) -> Contest:
+        return self._contests[ContestKey.of(result)]
+
+    def ids_matching(self, field: str, value: str) -> frozenset[int]:
+        """
+        Rows whose field contains every token of value. Candidate names
+        with no exact match fall back to phonetic keys.
+        """
+        ids = self._ids_with_tokens(self._index[field], _field_tokens(field, value))
+        if not ids and field == "candidate_name":
+            ids = self._ids_with_tokens(
+                self._phonetic, [phonetic_key(t) for t in tokens(value)]
+            )
+        return ids
+
+    @staticmethod
+    def _ids_with_tokens(
+        postings: dict[str, frozenset[int]], value_tokens: list[str]
+    ) -> frozenset[int]:
+        ids: Optional[frozenset[int]] = None
+        for token in value_tokens:
+            found = postings.get(token, frozenset())
+            ids = found if ids is None else ids & found
+            if not ids:
+                return frozenset()
+        return ids or frozenset()
+
+    def find(self, criteria: list[tuple[str, str]]) -> Optional[ResultRecord]:
+        """First row (lowest id) satisfying every (field, value) criterion."""
+        ids: Optional[frozenset[int]] = None
+        for field, value in criteria:
+            found = self.ids_matching(field, value)
+            ids = found if ids is None else ids & found
+            if not ids:
+                return None
+        return self._by_id[min(ids)] if ids else None
+
+    @classmethod
+    async def load(cls, db: AsyncSession, version: str) -> "ResultsSnapshot":
+        # Sources come from the shared cache rather than being joined onto
+        # every result row
+        sources = await source_cache.all(db)
+        rows = await db.execute(select(ElectionResult))
+        results = []
+        for r in rows.scalars().all():
+            source = sources.get(r.source_id)
+            results.append(
+                ResultRecord(
+                    id=r.id,
+                    source_id=r.source_id,
+                    election_level=r.election_level,
+                    election_year=r.election_year,
+                    district=r.district,
+                    constituency=r.constituency,
+                    polling_station=r.polling_station,
+                    position=r.position,
+                    candidate_name=r.candidate_name,
+                    party=r.party,
+                    vote_count=r.vote_count,
+                    percentage=r.percentage,
+                    total_valid_votes=r.total_valid_votes,
+                    is_winner=r.is_winner or 0,
+                    last_updated=r.last_updated,
+                    source=source,
+                )
+            )
+        # Building the indexes and the ranker is CPU-bound; keep it off
+        # the event loop
+        return await asyncio.to_thread(cls, version, results)
+
+
+class SnapshotStore:
+    """Holds the current ResultsSnapshot and swaps it when data changes."""
+
+    def __init__(self, data_version: DataVersionTracker):
+        self._data_version = data_version
+        self._snapshot: Optional[ResultsSnapshot] = None
+        self._lock = asyncio.Lock()
+
+    async def current(self, db: AsyncSession) -> ResultsSnapshot:
+        version = await self._data_version.current(db)
+        snapshot = self._snapshot
+        if snapshot is not None and (snapshot.version == version or self._lock.locked()):
+            # Up to date, or a rebuild is already running: serve what we have
+            return snapshot
+
+        async with self._lock:
+            if self._snapshot is None or self._snapshot.version != version:
+                # The version covers official_sources too, so drop any
+                # sources cached before the change
+                source_cache.invalidate()
+                contest_cache.invalidate()
+                self._snapshot = await ResultsSnapshot.load(db, version)
+                print(f"Results snapshot loaded: {len(self._snapshot)} rows (version {version})")
+        return self._snapshot
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "version": snapshot.version if snapshot else None,
+            "rows": len(snapshot) if snapshot else 0,
+        }
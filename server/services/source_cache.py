@@ -0,0 +1,71 @@
+"""
+Process-wide cache of official_sources.
+
+The table holds a handful of rows that only change when the scraper or
+seed runs, so it is read whole and kept in memory. Ingest calls
+invalidate(); a TTL covers ingest that happens in another process
+(Celery, the seed script).
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.models.database import OfficialSource
+
+
+@dataclass(frozen=True)
+class SourceRecord:
+    id: int
+    name: str
+    url: Optional[str]
+    description: Optional[str]
+    content_hash: Optional[str]
+    last_scraped: Optional[datetime]
+
+
+def to_source_record(s: OfficialSource) -> SourceRecord:
+    return SourceRecord(
+        id=s.id,
+        name=s.name,
+        url=s.url,
+        description=s.description,
+        content_hash=s.content_hash,
+        last_scraped=s.last_scraped,
+    )
+
+
+class SourceCache:
+    def __init__(self, ttl_seconds: float = 30):
+        self.ttl_seconds = ttl_seconds
+        self._sources: Optional[dict[int, SourceRecord]] = None
+        self._loaded_at = 0.0
+
+    async def all(self, db: AsyncSession) -> dict[int, SourceRecord]:
+        sources = self._sources
+        if sources is not None and time.monotonic() - self._loaded_at < self.ttl_seconds:
+            return sources
+
+        rows = await db.execute(select(OfficialSource))
+        sources = {s.id: to_source_record(s) for s in rows.scalars().all()}
+        self._sources = sources
+        self._loaded_at = time.monotonic()
+        return sources
+
+    async def get(self, source_id: int, db: AsyncSession) -> Optional[SourceRecord]:
+        sources = await self.all(db)
+        if source_id not in sources and self._sources is sources:
+            # Unknown id: the table changed since we loaded it
+            self.invalidate()
+            sources = await self.all(db)
+        return sources.get(source_id)
+
+    def invalidate(self) -> None:
+        self._sources = None
+
+
+source_cache = SourceCache()
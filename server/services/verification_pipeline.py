@@ -0,0 +1,227 @@
+"""
+Claim verification independent of the HTTP layer.
+
+Entity extraction, matching and explanation, behind the response cache and
+single-flight, plus the write-behind verification record. The API builds
+one VerificationPipeline at startup from the components on app.state;
+Celery workers build their own to run async image jobs. Pool errors
+(PoolSaturatedError, PoolTimeoutError) propagate for the caller to map.
+"""
+
+import hashlib
+import unicodedata
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.config import Settings
+from server.models.schemas import (
+    ExtractedFields,
+    OfficialDataResponse,
+    SourceReferenceResponse,
+    VerificationResponse,
+)
+from server.services.cache_service import CacheService
+from server.services.claim_partitions import expiry_for
+from server.services.data_version import DataVersionTracker
+from server.services.deterministic_matcher import DeterministicMatcher
+from server.services.entity_extractor import EntityExtractor, extract_in_worker
+from server.services.explanation_generator import ExplanationGenerator
+from server.services.extract_batcher import ExtractBatcher
+from server.services.match_batcher import MatchBatcher
+from server.services.results_snapshot import SnapshotStore
+from server.services.single_flight import SingleFlight
+from server.services.verification_writer import VerificationWriter
+from server.services.worker_pool import WorkerPool
+
+settings = Settings()
+
+
+def normalize_claim(claim_text: str) -> str:
+    return " ".join(unicodedata.normalize("NFC", claim_text).split())
+
+
+def claim_cache_key(claim_text: str, data_version: str) -> str:
+    """Normalized claim text + official-data version (whitespace-insensitive)."""
+    return f"{data_version}:{normalize_claim(claim_text)}"
+
+
+def claim_fingerprint(claim_text: str, claim_type: str) -> str:
+    """Key of the claim's deduplicated claim_verifications row (with the data version)."""
+    return hashlib.sha256(f"{claim_type}:{normalize_claim(claim_text)}".encode()).hexdigest()
+
+
+class VerificationPipeline:
+    def __init__(
+        self,
+        nlp: Any,
+        nlp_pool: WorkerPool,
+        cache: CacheService,
+        single_flight: SingleFlight,
+        data_version: DataVersionTracker,
+        results_snapshot: SnapshotStore,
+        verification_writer: VerificationWriter,
+        match_batcher: Optional[MatchBatcher] = None,
+        extract_batcher: Optional[ExtractBatcher] = None,
+    ):
+        self.nlp = nlp
+        self.nlp_pool = nlp_pool
+        self.cache = cache
+        self.single_flight = single_flight
+        self.data_version = data_version
+        self.results_snapshot = results_snapshot
+        self.verification_writer = verification_writer
+        self.match_batcher = match_batcher
+        self.extract_batcher = extract_batcher
+
+    async def verify(
+        self,
+        claim_text: str,
+        claim_type: str,
+        db: AsyncSession,
+        client_host: Optional[str] = None,
+        extracted_text: Optional[str] = None,
+    ) -> dict:
+        """
+        Verify a text or image claim; returns VerificationResponse fields
+        (JSON-ready) plus extracted_text.
+
+        Responses are cached per (normalized claim, data version). Concurrent
+        misses for the same key share one computation, so a viral claim costs
+        one round of NER and matching rather than one per request.
+        """
+        data_version = await self.data_version.current(db)
+        key = claim_cache_key(claim_text, data_version)
+
+        result = await self.cache.get(key)
+        if result is None:
+
+            async def compute() -> dict:
+                computed = await self._run(claim_text, db)
+                await self.cache.set(key, computed, ttl=settings.verification_cache_ttl_seconds)
+                return computed
+
+            result = await self.single_flight.do(key, compute)
+
+        # Every request counts as a hit on the claim's row, cached or not
+        self.record(result, claim_text, claim_type, extracted_text, data_version, client_host)
+
+        # Shared results may come from another upload of the same text
+        return {**result, "extracted_text": extracted_text}
+
+    async def _extract_entities(self, claim_text: str) -> dict:
+        """Run entity extraction on the NLP worker pool, batched if enabled."""
+        if self.extract_batcher is not None:
+            return await self.extract_batcher.extract(claim_text)
+        if self.nlp_pool.kind == "process":
+            fn = extract_in_worker
+        else:
+            fn = EntityExtractor(self.nlp).extract
+        return await self.nlp_pool.run(fn, claim_text)
+
+    async def _run(self, claim_text: str, db: AsyncSession) -> dict:
+        # 1. Extract entities (off the event loop)
+        extracted = await self._extract_entities(claim_text)
+
+        # 2. Match against official data (in-memory snapshot unless disabled;
+        # the SQL backend may batch lookups across requests)
+        if settings.matcher_backend == "snapshot":
+            snapshot = await self.results_snapshot.current(db)
+            match_result = await DeterministicMatcher(snapshot).match(extracted, db)
+        elif self.match_batcher is not None:
+            match_result = await self.match_batcher.match(extracted)
+        else:
+            match_result = await DeterministicMatcher().match(extracted, db)
+
+        # 3. Generate explanation
+        generator = ExplanationGenerator()
+        explanation = generator.generate(
+            match_result.alignment,
+            extracted,
+            match_result.official_result,
+            match_result.conflicts,
+            match_result.candidates,
+        )
+
+        # 4. Build response data
+        official_data = None
+        source_ref = None
+
+        if match_result.official_result:
+            r = match_result.official_result
+            s = match_result.source
+
+            official_data = OfficialDataResponse(
+                candidate_name=r.candidate_name,
+                party=r.party or "Independent",
+                position=r.position,
+                district=r.district,
+                vote_count=r.vote_count,
+                percentage=r.percentage or 0.0,
+                total_votes=r.total_valid_votes or 0,
+                source_name=s.name if s else "Uganda Electoral Commission",
+                source_url=s.url if s else None,
+                last_updated=r.last_updated or datetime.utcnow(),
+            )
+
+            source_ref = SourceReferenceResponse(
+                name=s.name if s else "Uganda Electoral Commission",
+                url=s.url if s else None,
+                last_updated=s.last_scraped or r.last_updated or datetime.utcnow(),
+            )
+
+        response = VerificationResponse(
+            alignment=match_result.alignment.value,
+            extracted_fields=ExtractedFields(**extracted),
+            official_data=official_data,
+            explanation=explanation,
+            confidence=match_result.confidence,
+            source_reference=source_ref,
+            verified_at=datetime.utcnow(),
+        )
+        return {
+            **response.model_dump(mode="json"),
+            # Not part of the response models; kept for the verification record
+            "matched_result_id": (
+                match_result.official_result.id if match_result.official_result else None
+            ),
+        }
+
+    def record(
+        self,
+        result: dict,
+        claim_text: str,
+        claim_type: str,
+        extracted_text: Optional[str],
+        data_version: str,
+        client_host: Optional[str],
+    ) -> None:
+        """
+        Queue an upsert of the claim's verification row, keyed by claim
+        fingerprint + data version + expiry hour (auto-expires within 24h of
+        the last hit). Public so responses served from the image cache
+        count as hits too.
+        """
+        now = datetime.utcnow()
+        ip_hash = hashlib.sha256((client_host or "unknown").encode()).hexdigest()[:16]
+
+        self.verification_writer.submit(
+            {
+                "fingerprint": claim_fingerprint(claim_text, claim_type),
+                "data_version": data_version,
+                "claim_text": claim_text[:500],  # Truncate for privacy
+                "claim_type": claim_type,
+                "extracted_text": extracted_text,
+                "extracted_fields": result["extracted_fields"],
+                "matched_result_id": result.get("matched_result_id"),
+                "alignment_status": result["alignment"],
+                "confidence": result["confidence"],
+                "explanation": result["explanation"],
+                "ip_hash": ip_hash,
+                "verified_at": now,
+                "last_seen": now,
+                "hit_count": 1,
+                "expires_at": expiry_for(now, settings.claim_retention_hours),
+            }
+        )
@@ -0,0 +1,165 @@
+import asyncio
+import time
+from typing import Callable, Optional
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.models.database import ClaimVerification
+
+
+def _merge_hits(batch: list[dict]) -> list[dict]:
+    """
+    Collapse records for the same (fingerprint, data_version) into one,
+    summing hit_count and keeping the first verified_at and the latest
+    everything else (expiry hour included) — one INSERT ... ON CONFLICT
+    cannot touch a row twice.
+    """
+    merged: dict[tuple[str, str], dict] = {}
+    for values in batch:
+        key = (values["fingerprint"], values["data_version"])
+        current = merged.get(key)
+        if current is None:
+            merged[key] = dict(values)
+        else:
+            merged[key] = {
+                **values,
+                "verified_at": current["verified_at"],
+                "hit_count": current["hit_count"] + values["hit_count"],
+            }
+    return list(merged.values())
+
+
+def _upsert(rows: list[dict]):
+    stmt = insert(ClaimVerification).values(rows)
+    excluded = stmt.excluded
+    return stmt.on_conflict_do_update(
+        # expires_at is the partition key, so a hit in a later expiry hour
+        # starts a new row in that hour's partition rather than moving this one
+        index_elements=["fingerprint", "data_version", "expires_at"],
+        set_={
+            "hit_count": ClaimVerification.hit_count + excluded.hit_count,
+            "last_seen": excluded.last_seen,
+            "ip_hash": excluded.ip_hash,
+            "extracted_text": excluded.extracted_text,
+        },
+    )
+
+
+class VerificationWriter:
+    """
+    Write-behind persistence for ClaimVerification records.
+
+    Requests hand their record to submit() and return immediately; a
+    background task upserts queued records with one multi-row INSERT ...
+    ON CONFLICT when max_batch records are waiting or flush_interval
+    seconds have passed, whichever comes first. Repeats of a claim (same
+    fingerprint and data version) within one expiry hour land on one row
+    whose hit_count and last_seen advance. close() drains the queue on shutdown.
+
+    The records only back the 24h privacy window, so if the database is
+    unreachable for long enough that max_pending records pile up, the
+    oldest are dropped (and counted) rather than growing without bound.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        max_batch: int = 500,
+        flush_interval: float = 1.0,
+        max_pending: int = 10_000,
+    ):
+        self._session_factory = session_factory
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        # (enqueued_at, column values)
+        self._pending: list[tuple[float, dict]] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+        self.written = 0
+        self.batches = 0
+        self.dropped = 0
+        self.failures = 0
+        self.last_flush_lag = 0.0
+        self.max_flush_lag = 0.0
+        self.last_flush_ms = 0.0
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def submit(self, values: dict) -> None:
+        """Queue one claim_verifications row (column name -> value)."""
+        self._pending.append((time.monotonic(), values))
+        overflow = len(self._pending) - self.max_pending
+        if overflow > 0:
+            del self._pending[:overflow]
+            self.dropped += overflow
+        if len(self._pending) >= self.max_batch:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write everything queued so far, max_batch rows per INSERT."""
+        written = 0
+        while self._pending:
+            batch = self._pending[: self.max_batch]
+            del self._pending[: len(batch)]
+            started = time.monotonic()
+            try:
+                async with self._session_factory() as db:
+                    await db.execute(_upsert(_merge_hits([v for _, v in batch])))
+                    await db.commit()
+            except Exception as e:
+                self.failures += 1
+                print(f"WARNING: Failed to write {len(batch)} claim verifications: {e}")
+                # Put the batch back for the next flush (within the cap)
+                room = self.max_pending - len(self._pending)
+                requeued = batch[-room:] if room > 0 else []
+                self.dropped += len(batch) - len(requeued)
+                self._pending[:0] = requeued
+                break
+
+            now = time.monotonic()
+            self.last_flush_ms = (now - started) * 1000
+            # Lag: how long the oldest record in the batch waited to be durable
+            self.last_flush_lag = now - batch[0][0]
+            self.max_flush_lag = max(self.max_flush_lag, self.last_flush_lag)
+            self.batches += 1
+            self.written += len(batch)
+            written += len(batch)
+        return written
+
+    async def close(self) -> None:
+        """Stop the background task and drain the queue."""
+        self._closing = True
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self.flush()
+
+    def stats(self) -> dict:
+        oldest = self._pending[0][0] if self._pending else None
+        return {
+            "pending": len(self._pending),
+            "oldest_pending_seconds": round(time.monotonic() - oldest, 3) if oldest else 0.0,
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "failures": self.failures,
+            "last_flush_lag_seconds": round(self.last_flush_lag, 3),
+            "max_flush_lag_seconds": round(self.max_flush_lag, 3),
+            "last_flush_ms": round(self.last_flush_ms, 1),
+        }
@@ -0,0 +1,127 @@
+"""
+Bounded executor for CPU-bound work called from async endpoints.
+
+spaCy parsing (and later OCR) is synchronous; running it directly inside
+a coroutine stalls every other request on the event loop. WorkerPool hands
+the work to a thread or process pool, caps how much may be waiting, and
+enforces a per-call timeout.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+
+class PoolSaturatedError(RuntimeError):
+    """Raised when a pool's admission queue is full."""
+
+
+class PoolTimeoutError(TimeoutError):
+    """Raised when a call does not finish within the pool timeout."""
+
+
+class WorkerPool:
+    def __init__(
+        self,
+        name: str,
+        kind: str = "thread",
+        max_workers: int = 0,
+        max_queue: int = 64,
+        timeout: float = 10.0,
+        initializer: Optional[Callable] = None,
+        initargs: tuple = (),
+    ):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown worker pool kind: {kind!r}")
+
+        self.name = name
+        self.kind = kind
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._timed_out = 0
+
+        if kind == "process":
+            self._executor: Executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=initializer,
+                initargs=initargs,
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=f"{name}-worker",
+                initializer=initializer,
+                initargs=initargs,
+            )
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls admitted but still waiting for a free worker."""
+        return max(0, self._in_flight - self.max_workers)
+
+    @property
+    def saturated(self) -> bool:
+        """True when a new call would be rejected right now."""
+        return self._in_flight >= self.max_workers + self.max_queue
+
+    async def run(self, fn: Callable, *args: Any) -> Any:
+        """
+        Run fn(*args) on the pool. Raises PoolSaturatedError when the queue
+        is full and PoolTimeoutError when the call exceeds the timeout.
+        """
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise PoolSaturatedError(f"{self.name} pool is saturated")
+            self._in_flight += 1
+
+        try:
+            future = self._executor.submit(partial(fn, *args))
+        except Exception:
+            self._release(None)
+            raise
+        # The slot is held until the work really finishes, even if the
+        # caller gives up, so a timed-out job still counts against capacity
+        future.add_done_callback(self._release)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            with self._lock:
+                self._timed_out += 1
+            raise PoolTimeoutError(
+                f"{self.name} work did not finish within {self.timeout}s"
+            )
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "workers": self.max_workers,
+                "in_flight": self._in_flight,
+                "queue_depth": max(0, self._in_flight - self.max_workers),
+                "max_queue": self.max_queue,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "timed_out": self._timed_out,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
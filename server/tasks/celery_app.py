@@ -8,6 +8,11 @@ celery_app = Celery(
     "yesveri",
     broker=settings.redis_url,
     backend=settings.redis_url,
+    include=[
+        "server.tasks.cleanup_tasks",
+        "server.tasks.scraper_tasks",
+        "server.tasks.verify_tasks",
+    ],
 )
 
 celery_app.conf.update(
@@ -23,6 +28,10 @@ celery_app.conf.beat_schedule = {
         "task": "server.tasks.cleanup_tasks.cleanup_expired",
         "schedule": 3600.0,  # Every hour
     },
+    "create-claim-partitions": {
+        "task": "server.tasks.cleanup_tasks.create_claim_partitions",
+        "schedule": 3600.0,  # Every hour
+    },
     "refresh-ec-data": {
         "task": "server.tasks.scraper_tasks.refresh_ec_data",
         "schedule": settings.ec_scrape_interval_hours * 3600,
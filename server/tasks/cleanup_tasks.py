@@ -9,11 +9,37 @@ def cleanup_expired():
     asyncio.run(_cleanup())
 
 
+@celery_app.task(name="server.tasks.cleanup_tasks.create_claim_partitions")
+def create_claim_partitions():
+    """Pre-create the hourly claim_verifications partitions ahead of use."""
+    asyncio.run(_create_partitions())
+
+
 async def _cleanup():
+    from server.config import Settings
     from server.db.session import AsyncSessionLocal
     from server.services.cleanup_service import CleanupService
 
+    settings = Settings()
     async with AsyncSessionLocal() as db:
-        service = CleanupService()
+        service = CleanupService(
+            mode=settings.cleanup_mode,
+            batch_size=settings.cleanup_batch_size,
+            sleep_seconds=settings.cleanup_batch_sleep_seconds,
+        )
         count = await service.delete_expired(db)
         print(f"Cleaned up {count} expired claim verifications")
+
+
+async def _create_partitions():
+    from server.config import Settings
+    from server.db.session import AsyncSessionLocal
+    from server.services.claim_partitions import ensure_partitions
+
+    settings = Settings()
+    async with AsyncSessionLocal() as db:
+        created = await ensure_partitions(
+            db, settings.claim_retention_hours, settings.claim_partitions_ahead_hours
+        )
+        if created:
+            print(f"Created {created} claim_verifications partitions")
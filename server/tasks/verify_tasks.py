@@ -0,0 +1,189 @@
+import asyncio
+import base64
+
+from server.tasks.celery_app import celery_app
+
+VERIFY_IMAGE_TASK = "server.tasks.verify_tasks.verify_image_job"
+
+# One event loop, job store and pipeline per worker process, kept across
+# tasks so the caches and results snapshot are reused
+_loop = None
+_jobs = None
+_context = None
+
+
+def _run(coro):
+    global _loop
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+    return _loop.run_until_complete(coro)
+
+
+class _ImageJobTask(celery_app.Task):
+    def on_failure(self, exc, task_id, args, kwargs, einfo):
+        """
+        The task raised before recording an outcome (e.g. the pipeline
+        failed to load): fail the job now instead of leaving it queued
+        until it expires.
+        """
+        job_id = args[0] if args else kwargs.get("job_id")
+        print(f"WARNING: Image job {job_id} crashed: {exc}")
+        try:
+            _run(_fail_unfinished(job_id))
+        except Exception as e:
+            print(f"WARNING: Could not mark image job {job_id} failed: {e}")
+
+
+@celery_app.task(name=VERIFY_IMAGE_TASK, base=_ImageJobTask, ignore_result=True)
+def verify_image_job(job_id: str, image_b64: str, client_host: str):
+    """
+    OCR and verify an uploaded image for an async job. The bytes arrive
+    base64-encoded in the task message and are never written to disk;
+    only the OCR text, dHash and result are kept, in the job store.
+    """
+    _run(_verify_image(job_id, base64.b64decode(image_b64), client_host))
+
+
+def _job_store():
+    # Separate from the pipeline so a job can still be failed when the
+    # pipeline cannot be built
+    global _jobs
+    if _jobs is None:
+        from server.config import Settings
+        from server.services.job_store import JobStore
+
+        settings = Settings()
+        _jobs = JobStore(settings.redis_url, settings.image_job_ttl_seconds)
+    return _jobs
+
+
+async def _fail_unfinished(job_id: str):
+    from server.services.job_store import TERMINAL_STATUSES
+
+    jobs = _job_store()
+    job = await jobs.get(job_id)
+    if job is not None and job["status"] in TERMINAL_STATUSES:
+        return
+    await jobs.update(
+        job_id,
+        "failed",
+        error={"status_code": 500, "detail": "Verification failed. Please try again."},
+    )
+
+
+def _worker_context():
+    global _context
+    if _context is None:
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+        from sqlalchemy.pool import NullPool
+
+        from server.config import Settings
+        from server.db.session import db_url
+        from server.services.cache_service import CacheService
+        from server.services.data_version import DataVersionTracker
+        from server.services.entity_extractor import load_spacy_model
+        from server.services.ocr_processor import init_ocr_worker
+        from server.services.results_snapshot import SnapshotStore
+        from server.services.single_flight import SingleFlight
+        from server.services.verification_pipeline import VerificationPipeline
+        from server.services.verification_writer import VerificationWriter
+        from server.services.worker_pool import WorkerPool
+
+        settings = Settings()
+        # Not the shared engine: other tasks in this process use it from
+        # their own asyncio.run loops, and an asyncpg connection only works
+        # on the loop that opened it. NullPool holds no connection between tasks.
+        session_factory = async_sessionmaker(
+            create_async_engine(db_url, poolclass=NullPool),
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+        init_ocr_worker(settings.tesseract_cmd, settings.ocr_backend, settings.tessdata_path)
+        data_version = DataVersionTracker(settings.data_version_ttl_seconds)
+        pipeline = VerificationPipeline(
+            nlp=load_spacy_model(),
+            nlp_pool=WorkerPool(
+                "nlp", kind="thread", max_workers=1, timeout=settings.nlp_timeout_seconds
+            ),
+            cache=CacheService(
+                settings.redis_url,
+                l1_max_entries=settings.cache_l1_max_entries,
+                l1_ttl_seconds=settings.cache_l1_ttl_seconds,
+            ),
+            single_flight=SingleFlight(),
+            data_version=data_version,
+            results_snapshot=SnapshotStore(data_version),
+            # Flushed at the end of each task rather than on a timer
+            verification_writer=VerificationWriter(
+                session_factory, max_batch=settings.verification_flush_batch_size
+            ),
+        )
+        _context = (pipeline, session_factory)
+    return _context
+
+
+async def _verify_image(job_id: str, contents: bytes, client_host: str):
+    from server.services.ocr_processor import ocr_in_worker
+    from server.services.worker_pool import PoolSaturatedError, PoolTimeoutError
+
+    jobs = _job_store()
+    pipeline, session_factory = _worker_context()
+    await jobs.update(job_id, "processing")
+
+    # Same errors, status codes and messages as the synchronous endpoint
+    try:
+        extracted_text, image_dhash = ocr_in_worker(contents)
+    except Exception as e:
+        await jobs.update(
+            job_id,
+            "failed",
+            error={"status_code": 422, "detail": f"Could not extract text from image: {str(e)}"},
+        )
+        return
+
+    if not extracted_text.strip():
+        await jobs.update(
+            job_id,
+            "failed",
+            error={
+                "status_code": 422,
+                "detail": "No text could be extracted from the image. Try a clearer screenshot.",
+            },
+        )
+        return
+
+    try:
+        async with session_factory() as db:
+            result = await pipeline.verify(
+                claim_text=extracted_text,
+                claim_type="image",
+                db=db,
+                client_host=client_host,
+                extracted_text=extracted_text,
+            )
+    except PoolSaturatedError:
+        await jobs.update(
+            job_id,
+            "failed",
+            error={"status_code": 503, "detail": "Server is busy. Please try again shortly."},
+        )
+        return
+    except PoolTimeoutError:
+        await jobs.update(
+            job_id,
+            "failed",
+            error={"status_code": 504, "detail": "Claim analysis timed out. Try a shorter claim."},
+        )
+        return
+    except Exception as e:
+        print(f"WARNING: Image job {job_id} failed: {e}")
+        await jobs.update(
+            job_id,
+            "failed",
+            error={"status_code": 500, "detail": "Verification failed. Please try again."},
+        )
+        return
+
+    # The dHash lets the API index the result for near-duplicate uploads
+    await jobs.update(job_id, "done", result=result, image_dhash=image_dhash)
+    await pipeline.verification_writer.flush()
@@ -0,0 +1,56 @@
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from server.api.middleware import BodySizeLimitMiddleware
+
+LIMIT = 1000
+BOUNDARY = "limit-test"
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+
+    @app.post("/upload")
+    async def upload(image: UploadFile = File(...)):
+        return {"size": len(await image.read())}
+
+    app.add_middleware(BodySizeLimitMiddleware, limits={"/upload": LIMIT})
+    return TestClient(app)
+
+
+def _multipart(payload_size: int):
+    """Multipart body as a generator, so it is sent chunked with no Content-Length."""
+    yield (
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="image"; filename="a.png"\r\n'
+        "Content-Type: image/png\r\n\r\n"
+    ).encode()
+    for _ in range(payload_size // 100):
+        yield b"a" * 100
+    yield f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+def _post(client: TestClient, payload_size: int):
+    return client.post(
+        "/upload",
+        content=_multipart(payload_size),
+        headers={"content-type": f"multipart/form-data; boundary={BOUNDARY}"},
+    )
+
+
+def test_chunked_upload_over_limit_is_413():
+    response = _post(_client(), 5 * LIMIT)
+    assert response.request.headers.get("content-length") is None
+    assert response.status_code == 413
+    assert response.json() == {"detail": "Request body too large."}
+
+
+def test_chunked_upload_under_limit_passes():
+    response = _post(_client(), 500)
+    assert response.status_code == 200
+    assert response.json() == {"size": 500}
+
+
+def test_content_length_over_limit_is_413():
+    response = _client().post("/upload", files={"image": ("a.png", b"a" * (5 * LIMIT))})
+    assert response.status_code == 413
@@ -0,0 +1,56 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from server.services.results_snapshot import ResultRecord  # noqa: E402
+from server.services.candidate_ranker import CandidateRanker  # noqa: E402
+
+
+def _record(id, candidate_name, district="Kampala", position="President"):
+    return ResultRecord(
+        id=id,
+        source_id=1,
+        election_level="national",
+        election_year=2021,
+        district=district,
+        constituency=None,
+        polling_station=None,
+        position=position,
+        candidate_name=candidate_name,
+        party=None,
+        vote_count=100,
+        percentage=None,
+        total_valid_votes=None,
+        is_winner=0,
+        last_updated=None,
+        source=None,
+    )
+
+
+@pytest.fixture
+def ranker():
+    return CandidateRanker(
+        [
+            _record(1, "Yoweri Kaguta Museveni"),
+            _record(2, "Robert Kyagulanyi Ssentamu"),
+            _record(3, "Patrick Oboi Amuriat"),
+            _record(4, "Robert Kasibante", district="Wakiso"),
+        ]
+    )
+
+
+def test_misspelled_name_ranks_first(ranker):
+    ranked = ranker.rank({"candidate_name": "Kyagulani"}, k=2)
+    assert ranked[0].result.id == 2
+    assert ranked[0].components["name"] > 0.75
+
+
+def test_district_breaks_name_tie(ranker):
+    ranked = ranker.rank({"candidate_name": "Robert", "district": "Wakiso"}, k=2)
+    assert ranked[0].result.id == 4
+
+
+def test_dissimilar_tokens_score_zero(ranker):
+    # Outside the length and character-count bounds: never edit-scored
+    ranked = ranker.rank({"candidate_name": "Zzzz Qqq"}, k=4)
+    assert all(candidate.components["name"] == 0.0 for candidate in ranked)
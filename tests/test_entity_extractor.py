@@ -0,0 +1,45 @@
+import pytest
+
+from server.services.entity_extractor import EntityExtractor
+
+
+class _Doc:
+    ents = []
+
+
+@pytest.fixture
+def extract():
+    # No spaCy model needed: the gazetteer and patterns do the work
+    return EntityExtractor(lambda text: _Doc()).extract
+
+
+def test_won_by_percentage_is_not_a_margin(extract):
+    fields = extract("Museveni won by 58.6%")
+    assert fields["percentage"] == 58.6
+    assert fields["margin"] is None
+
+
+def test_won_by_whole_percentage_is_not_a_margin(extract):
+    fields = extract("Museveni won by 58 percent")
+    assert fields["percentage"] == 58.0
+    assert fields["margin"] is None
+
+
+def test_beat_by_votes_is_a_margin(extract):
+    fields = extract("Kyagulanyi beat Museveni by 20,000 votes")
+    assert fields["margin"] == 20000
+    assert fields["vote_count"] is None
+    assert fields["candidate_name"] == "Robert Kyagulanyi Ssentamu"
+    assert fields["candidate_names"] == ["Robert Kyagulanyi Ssentamu", "Yoweri Kaguta Museveni"]
+
+
+def test_margin_is_not_read_as_vote_count(extract):
+    fields = extract("Museveni got 6,042,898 votes and won by 3,301,660 votes")
+    assert fields["vote_count"] == 6042898
+    assert fields["margin"] == 3301660
+
+
+def test_came_second(extract):
+    fields = extract("Kyagulanyi came second")
+    assert fields["claimed_rank"] == 2
+    assert fields["margin"] is None
@@ -0,0 +1,61 @@
+from server.services.gazetteer import (
+    CANDIDATE,
+    DISTRICT,
+    PARTY,
+    POSITION,
+    Gazetteer,
+    build_entries,
+)
+
+
+def _gazetteer() -> Gazetteer:
+    return Gazetteer(
+        build_entries(
+            candidates={
+                "Museveni": "Yoweri Kaguta Museveni",
+                "Kyagulanyi": "Robert Kyagulanyi Ssentamu",
+                "Bobi Wine": "Robert Kyagulanyi Ssentamu",
+            },
+            districts=["Kampala", "Kampala Central", "Wakiso"],
+            positions=["MP", "President"],
+            parties=["NRM", "NUP", "ANT"],
+        )
+    )
+
+
+def test_longest_district_wins():
+    best = _gazetteer().find("Results from Kampala Central are in")
+    assert best[DISTRICT].canonical == "Kampala Central"
+
+
+def test_position_not_matched_inside_word():
+    matches = _gazetteer().find_all("Kampala results")
+    assert [m.canonical for m in matches] == ["Kampala"]
+    assert _gazetteer().find("Kampala results")[POSITION] is None
+
+
+def test_party_abbreviation_is_case_sensitive():
+    gazetteer = _gazetteer()
+    assert gazetteer.find("an ant crossed the road")[PARTY] is None
+    assert gazetteer.find("ANT won the seat")[PARTY].canonical == "ANT"
+
+
+def test_names_ignore_case_and_map_to_canonical():
+    best = _gazetteer().find("BOBI WINE won in wakiso")
+    assert best[CANDIDATE].canonical == "Robert Kyagulanyi Ssentamu"
+    assert best[DISTRICT].canonical == "Wakiso"
+
+
+def test_equal_length_tie_goes_to_earliest_mention():
+    best = _gazetteer().find("NUP beat NRM")
+    assert best[PARTY].canonical == "NUP"
+
+
+def test_find_all_is_ordered_by_end():
+    matches = _gazetteer().find_all("Museveni (NRM) beat Kyagulanyi for President")
+    assert [(m.category, m.canonical) for m in matches] == [
+        (CANDIDATE, "Yoweri Kaguta Museveni"),
+        (PARTY, "NRM"),
+        (CANDIDATE, "Robert Kyagulanyi Ssentamu"),
+        (POSITION, "President"),
+    ]
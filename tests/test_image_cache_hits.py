@@ -0,0 +1,68 @@
+import hashlib
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from server.api.endpoints import verify
+from server.db.session import get_db
+from server.services.image_cache import ImageResultCache
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+DATA_VERSION = "v1"
+
+
+class FakeDataVersion:
+    async def current(self, db):
+        return DATA_VERSION
+
+
+class FakeOCRPool:
+    saturated = False
+
+    async def run(self, fn, *args):
+        raise AssertionError("an exact cache hit must not run OCR")
+
+
+class FakePipeline:
+    def __init__(self):
+        self.recorded = []
+
+    def record(self, result, claim_text, claim_type, extracted_text, data_version, client_host):
+        self.recorded.append((claim_text, claim_type, extracted_text, data_version))
+
+
+def _cached_result() -> dict:
+    return {
+        "alignment": "MATCHES",
+        "extracted_fields": {"candidate_name": "Yoweri Kaguta Museveni"},
+        "explanation": "Matches the official count.",
+        "confidence": 0.9,
+        "verified_at": datetime(2026, 1, 1).isoformat(),
+        "matched_result_id": 1,
+        "extracted_text": "Museveni got 6,042,898 votes",
+    }
+
+
+def test_exact_image_cache_hit_is_recorded():
+    app = FastAPI()
+    app.include_router(verify.router, prefix="/api")
+    app.dependency_overrides[get_db] = lambda: None
+
+    pipeline = FakePipeline()
+    image_cache = ImageResultCache()
+    image_cache.put(hashlib.sha256(PNG).hexdigest(), None, _cached_result(), DATA_VERSION)
+    app.state.pipeline = pipeline
+    app.state.image_cache = image_cache
+    app.state.data_version = FakeDataVersion()
+    app.state.ocr_pool = FakeOCRPool()
+
+    response = TestClient(app).post(
+        "/api/verify/image", files={"image": ("a.png", PNG, "image/png")}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["alignment"] == "MATCHES"
+    assert pipeline.recorded == [
+        ("Museveni got 6,042,898 votes", "image", "Museveni got 6,042,898 votes", DATA_VERSION)
+    ]
@@ -0,0 +1,55 @@
+import io
+
+from PIL import Image, ImageDraw
+
+from server.services import ocr_processor
+from server.services.ocr_processor import OCRProcessor
+
+
+class FakeTesseract:
+    def __init__(self):
+        self.images = []
+
+    def image_to_string(self, image, lang):
+        self.images.append(image)
+        return " Museveni got 6,042,898 votes \n"
+
+
+def _processor() -> tuple[OCRProcessor, FakeTesseract]:
+    # No tesseract binary needed: only the decode and hashing are under test
+    processor = OCRProcessor.__new__(OCRProcessor)
+    processor._api = None
+    processor._available = True
+    processor._pytesseract = FakeTesseract()
+    return processor, processor._pytesseract
+
+
+def _png(size: tuple[int, int]) -> bytes:
+    image = Image.new("RGB", (1200, 800), "white")
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((100, 100, 700, 400), fill="black")
+    draw.ellipse((800, 300, 1100, 700), fill="gray")
+    buffer = io.BytesIO()
+    image.resize(size).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_text_and_dhash_come_from_one_decode(monkeypatch):
+    processor, tesseract = _processor()
+    opened = []
+    real_open = Image.open
+    monkeypatch.setattr(ocr_processor.Image, "open", lambda fp: opened.append(fp) or real_open(fp))
+
+    text, dhash = processor.extract_text_and_dhash(_png((1200, 800)))
+
+    assert text == "Museveni got 6,042,898 votes"
+    assert len(opened) == 1
+    assert tesseract.images[0].mode == "L"
+    assert dhash == ocr_processor.dhash_image(tesseract.images[0])
+
+
+def test_resized_copy_has_close_dhash():
+    processor, _ = _processor()
+    _, original = processor.extract_text_and_dhash(_png((1200, 800)))
+    _, resized = processor.extract_text_and_dhash(_png((600, 400)))
+    assert bin(original ^ resized).count("1") <= 2
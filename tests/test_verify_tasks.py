@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("celery")
+
+from server.services import ocr_processor  # noqa: E402
+from server.services.job_store import JobStore  # noqa: E402
+from server.tasks import verify_tasks  # noqa: E402
+
+
+class FakeJobStore:
+    def __init__(self, jobs=None):
+        self.jobs = jobs or {}
+
+    async def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    async def update(self, job_id, status, **fields):
+        job = self.jobs.setdefault(job_id, {"job_id": job_id})
+        job.update(fields, status=status)
+        return job
+
+
+class FakeWriter:
+    def __init__(self):
+        self.flushes = 0
+
+    async def flush(self):
+        self.flushes += 1
+
+
+class FakePipeline:
+    def __init__(self):
+        self.verification_writer = FakeWriter()
+        self.claims = []
+
+    async def verify(self, claim_text, claim_type, db, client_host=None, extracted_text=None):
+        self.claims.append((claim_text, claim_type))
+        return {"alignment": "MATCHES", "extracted_text": extracted_text}
+
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    jobs = FakeJobStore({"job-1": {"job_id": "job-1", "status": "queued"}})
+    pipeline = FakePipeline()
+    monkeypatch.setattr(verify_tasks, "_jobs", jobs)
+    monkeypatch.setattr(verify_tasks, "_context", (pipeline, FakeSession))
+    return jobs, pipeline
+
+
+def test_job_store_is_built_lazily(monkeypatch):
+    monkeypatch.setattr(verify_tasks, "_jobs", None)
+    assert isinstance(verify_tasks._job_store(), JobStore)
+
+
+def test_verify_image_marks_job_done_with_dhash(worker, monkeypatch):
+    jobs, pipeline = worker
+    monkeypatch.setattr(ocr_processor, "ocr_in_worker", lambda contents: ("Museveni won", 42))
+
+    asyncio.run(verify_tasks._verify_image("job-1", b"png", "127.0.0.1"))
+
+    job = jobs.jobs["job-1"]
+    assert job["status"] == "done"
+    assert job["image_dhash"] == 42
+    assert job["result"]["extracted_text"] == "Museveni won"
+    assert pipeline.claims == [("Museveni won", "image")]
+    assert pipeline.verification_writer.flushes == 1
+
+
+def test_verify_image_fails_job_without_text(worker, monkeypatch):
+    jobs, pipeline = worker
+    monkeypatch.setattr(ocr_processor, "ocr_in_worker", lambda contents: ("  ", None))
+
+    asyncio.run(verify_tasks._verify_image("job-1", b"png", "127.0.0.1"))
+
+    assert jobs.jobs["job-1"]["status"] == "failed"
+    assert jobs.jobs["job-1"]["error"]["status_code"] == 422
+    assert pipeline.claims == []
+
+
+def test_fail_unfinished_fails_queued_job(worker):
+    jobs, _ = worker
+    asyncio.run(verify_tasks._fail_unfinished("job-1"))
+    assert jobs.jobs["job-1"]["status"] == "failed"
+    assert jobs.jobs["job-1"]["error"]["status_code"] == 500
+
+
+def test_fail_unfinished_keeps_finished_job(worker):
+    jobs, _ = worker
+    jobs.jobs["job-1"] = {"job_id": "job-1", "status": "done", "result": {}}
+    asyncio.run(verify_tasks._fail_unfinished("job-1"))
+    assert jobs.jobs["job-1"]["status"] == "done"